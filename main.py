@@ -13,20 +13,26 @@ Usage:
 """
 
 import argparse
-import asyncio
 import sys
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.assistant import VoiceAssistant
-from src.core.config import Config
-from src.core.logger import setup_logger
+# Heavy modules (whisper, openai, audio backends) are imported inside the
+# branch that needs them so --help and the utility modes start fast.
+
+# Utility modes, in order of precedence
+MODES = ("--setup", "--list-devices", "--list-voices", "--test-mic", "--web")
 
 
 def main():
     """Main entry point."""
+    # A lone utility flag skips building the argument parser entirely
+    if len(sys.argv) == 2 and sys.argv[1] in MODES:
+        run_mode(sys.argv[1])
+        return
+    
     parser = argparse.ArgumentParser(
         description="Nova Voice Assistant",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -84,30 +90,14 @@ def main():
         os.environ["LOG_LEVEL"] = "DEBUG"
     
     # Handle different modes
-    if args.setup:
-        run_setup()
-        return
-    
-    if args.list_devices:
-        assistant = VoiceAssistant()
-        assistant.list_devices()
-        return
-    
-    if args.list_voices:
-        from src.audio.tts import TextToSpeech
-        asyncio.run(show_voices())
-        return
-    
-    if args.test_mic:
-        assistant = VoiceAssistant()
-        assistant.test_microphone()
-        return
-    
-    if args.web:
-        run_web_dashboard()
-        return
+    for mode in MODES:
+        if getattr(args, mode.lstrip("-").replace("-", "_")):
+            run_mode(mode)
+            return
     
     # Normal run
+    from src.assistant import VoiceAssistant
+    
     try:
         assistant = VoiceAssistant()
         assistant.run()
@@ -120,6 +110,35 @@ def main():
         sys.exit(1)
 
 
+def run_mode(mode: str) -> None:
+    """Run a utility mode (anything other than the assistant itself)."""
+    if mode == "--setup":
+        run_setup()
+    elif mode == "--list-devices":
+        show_devices()
+    elif mode == "--list-voices":
+        import asyncio
+        asyncio.run(show_voices())
+    elif mode == "--test-mic":
+        test_microphone()
+    elif mode == "--web":
+        run_web_dashboard()
+
+
+def show_devices():
+    """Show available audio input devices."""
+    from src.assistant import VoiceAssistant
+    VoiceAssistant.list_devices()
+
+
+def test_microphone():
+    """Test the microphone with the configured recording settings."""
+    from src.assistant import VoiceAssistant
+    
+    # Components are lazy, so this only builds logging and the recorder
+    VoiceAssistant().test_microphone()
+
+
 async def show_voices():
     """Show available TTS voices."""
     from src.audio.tts import TextToSpeech
@@ -192,19 +211,29 @@ def run_setup():
 def run_web_dashboard():
     """Start the web dashboard."""
     try:
-        from src.web.app import create_app
+        from src.core.config import Config
         
-        app = create_app()
         config = Config()
         
+        # Greenlet servers need the stdlib patched before Flask, the TTS
+        # loop or any other threads are set up
+        if config.web_async_mode == "eventlet":
+            import eventlet
+            eventlet.monkey_patch()
+        elif config.web_async_mode == "gevent":
+            from gevent import monkey
+            monkey.patch_all()
+        
+        from src.web.app import run_server
+        
         print(f"\n🌐 Starting web dashboard at http://{config.web_host}:{config.web_port}")
-        app.run(
-            host=config.web_host,
-            port=config.web_port,
+        run_server(
+            config.web_host,
+            config.web_port,
             debug=config.get("web", "debug", default=False)
         )
-    except ImportError:
-        print("❌ Web dashboard not available. Install Flask first.")
+    except ImportError as e:
+        print(f"❌ Web dashboard not available ({e}). Install Flask first.")
         print("   pip install flask flask-socketio")
 
 
@@ -1,3 +1,16 @@
 # AI Module
-from .llm import LLMClient
-from .conversation import ConversationManager
+# Submodules are imported on first access (openai/httpx only when needed)
+import importlib
+
+_EXPORTS = {
+    "LLMClient": ".llm",
+    "ConversationManager": ".conversation",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
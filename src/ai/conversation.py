@@ -3,40 +3,148 @@ Conversation management with memory and persistence.
 Tracks message history and saves conversations to disk.
 """
 
-import json
-import uuid
+import asyncio
+import os
+import secrets
+import struct
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Deque, List, Dict, Any, Optional, Tuple
+
+import aiofiles
+import aiofiles.os
+import msgspec
+import orjson
 
 from ..core.logger import get_logger
 from ..core.config import Config
 
 logger = get_logger("nova.ai.conversation")
 
+# File extensions for session snapshots and append-only message logs
+SESSION_SUFFIX = ".msgpack"
+LOG_SUFFIX = ".log"
+
+# Small header sidecar so list_sessions never decodes message bodies
+META_SUFFIX = ".meta"
+
+# Human-readable sessions (custom-path exports and pre-msgpack saves)
+JSON_SUFFIX = ".json"
+
+# Preference when several files describe the same session in list_sessions
+_LISTING_ORDER = {META_SUFFIX: 0, SESSION_SUFFIX: 1, JSON_SUFFIX: 2}
+
+# list_sessions results per directory: (dir mtime_ns, sessions, by session_id).
+# Saves go through os.replace, so any write bumps the directory mtime
+_listing_cache: Dict[str, Tuple[int, List[Dict[str, Any]], Dict[str, Dict[str, Any]]]] = {}
+
+# Log frames are a 4-byte big-endian length followed by a msgpack Message
+_FRAME_HEADER = struct.Struct(">I")
+
+
+class Message(msgspec.Struct):
+    """A single persisted message."""
+    role: str
+    content: str
+    timestamp: str = ""
+
+
+class SessionHeader(msgspec.Struct):
+    """Session fields needed for listing (messages are skipped on decode)."""
+    session_id: str
+    created_at: str = ""
+    updated_at: str = ""
+    metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
+
+
+class Session(msgspec.Struct):
+    """A full persisted conversation session."""
+    session_id: str
+    created_at: str = ""
+    updated_at: str = ""
+    system_prompt: Optional[str] = None
+    messages: List[Message] = msgspec.field(default_factory=list)
+    metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
+    log_offset: int = 0  # Bytes of the message log covered by this snapshot
+    cleared_offset: int = 0  # Log position of the last clear_history()
+
+
+# Reusable encoder/decoders (building these is not free)
+_ENC = msgspec.msgpack.Encoder()
+_DEC = msgspec.msgpack.Decoder(Session)
+_HEADER_DEC = msgspec.msgpack.Decoder(SessionHeader)
+_MSG_DEC = msgspec.msgpack.Decoder(Message)
+
+
+def _encode_session(session: Session, path: Path) -> bytes:
+    """Encode a session for path: indented JSON for .json, else msgpack."""
+    if path.suffix == JSON_SUFFIX:
+        return orjson.dumps(msgspec.to_builtins(session), option=orjson.OPT_INDENT_2)
+    return _ENC.encode(session)
+
+
+def _decode_session(path: Path, header_only: bool = False) -> Any:
+    """Decode a session (or just its header) from a .msgpack or .json file."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    
+    if path.suffix == JSON_SUFFIX:
+        return msgspec.convert(orjson.loads(data), SessionHeader if header_only else Session)
+    return (_HEADER_DEC if header_only else _DEC).decode(data)
+
+
+def _read_log(log_path: Path, offset: int = 0) -> List[Message]:
+    """Read message frames from a session log, starting at a byte offset."""
+    messages = []
+    
+    if not log_path.exists():
+        return messages
+    
+    with open(log_path, 'rb') as f:
+        f.seek(offset)
+        while True:
+            header = f.read(_FRAME_HEADER.size)
+            if len(header) < _FRAME_HEADER.size:
+                break
+            
+            (size,) = _FRAME_HEADER.unpack(header)
+            payload = f.read(size)
+            if len(payload) < size:
+                break  # Torn write at the end of the log
+            
+            messages.append(_MSG_DEC.decode(payload))
+    
+    return messages
+
 
 class ConversationManager:
     """
     Manages conversation history with persistence.
     """
     
+    # Seconds to coalesce message writes into a single save
+    SAVE_DEBOUNCE = 0.25
+    
     def __init__(
         self,
         system_prompt: Optional[str] = None,
         max_history: int = 20,
         persist: bool = True,
         persist_path: Optional[str] = None,
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        snapshot_interval: int = 20
     ):
         """
         Initialize conversation manager.
         
         Args:
             system_prompt: System prompt for the assistant
-            max_history: Maximum messages to keep in history
+            max_history: Maximum messages to keep in memory (older ones stay in the log)
             persist: Whether to save conversations to disk
             persist_path: Directory to save conversations
             session_id: Session ID (None = generate new)
+            snapshot_interval: Logged messages between full snapshots
         """
         config = Config()
         
@@ -44,20 +152,41 @@ class ConversationManager:
         self.max_history = max_history
         self.persist = persist
         self.persist_path = Path(persist_path or config.conversations_path)
+        self.snapshot_interval = snapshot_interval
         
         # Session management
         self.session_id = session_id or self._generate_session_id()
         self.created_at = datetime.now()
         
-        # Message history
-        self._messages: List[Dict[str, str]] = []
+        # Message history: system prompt + bounded window of recent messages,
+        # kept as one list that is handed to the LLM as-is
+        self._system_msg: Optional[Dict[str, str]] = None
+        self._llm_view: List[Dict[str, str]] = []
+        
+        # Kept parallel to the window so the dicts sent to the LLM stay lean
+        self._timestamps: Deque[str] = deque(maxlen=max_history)
+        
+        # Session-wide counts (the deque only holds the recent window)
+        self._user_count = 0
+        self._assistant_count = 0
+        
+        # Persistence: messages are appended to a log, snapshots are periodic
+        self._log_fh = None
+        self._has_snapshot = False
+        self._unsnapshotted = 0
+        self._snapshot_requested = False
+        self._cleared_offset = 0  # Log messages before this were cleared
+        self._dirty = False
+        self._save_task: Optional[asyncio.Task] = None
+        self._save_now = asyncio.Event()
         
         # Add system prompt
         if self.system_prompt:
-            self._messages.append({
+            self._system_msg = {
                 "role": "system",
                 "content": self.system_prompt
-            })
+            }
+            self._llm_view.append(self._system_msg)
         
         # Ensure persist directory exists
         if self.persist:
@@ -67,57 +196,84 @@ class ConversationManager:
     
     def _generate_session_id(self) -> str:
         """Generate a unique session ID."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        short_uuid = str(uuid.uuid4())[:8]
-        return f"{timestamp}_{short_uuid}"
+        return f"{datetime.now():%Y%m%d_%H%M%S}_{secrets.token_hex(4)}"
+    
+    @property
+    def snapshot_path(self) -> Path:
+        """Path of this session's snapshot file."""
+        return self.persist_path / f"{self.session_id}{SESSION_SUFFIX}"
+    
+    @property
+    def meta_path(self) -> Path:
+        """Path of this session's header sidecar."""
+        return self.persist_path / f"{self.session_id}{META_SUFFIX}"
+    
+    @property
+    def log_path(self) -> Path:
+        """Path of this session's append-only message log."""
+        return self.persist_path / f"{self.session_id}{LOG_SUFFIX}"
+    
+    @property
+    def _window(self) -> List[Dict[str, str]]:
+        """In-memory messages without the system prompt."""
+        return self._llm_view[1:] if self._system_msg else list(self._llm_view)
     
     @property
     def messages(self) -> List[Dict[str, str]]:
-        """Get all messages including system prompt."""
-        return self._messages.copy()
+        """Get in-memory messages including system prompt."""
+        return list(self._llm_view)
     
     @property
     def messages_for_llm(self) -> List[Dict[str, str]]:
-        """Get messages formatted for LLM (respects max_history)."""
-        if len(self._messages) <= self.max_history + 1:  # +1 for system prompt
-            return self._messages.copy()
+        """
+        Get messages formatted for LLM (system prompt + last max_history).
         
-        # Keep system prompt + last N messages
-        return [self._messages[0]] + self._messages[-(self.max_history):]
+        This is the live list updated in place as messages are added;
+        treat it as read-only.
+        """
+        return self._llm_view
     
     @property
     def user_messages(self) -> List[str]:
         """Get only user messages."""
-        return [m["content"] for m in self._messages if m["role"] == "user"]
+        return [m["content"] for m in self._window if m["role"] == "user"]
     
     @property
     def assistant_messages(self) -> List[str]:
         """Get only assistant messages."""
-        return [m["content"] for m in self._messages if m["role"] == "assistant"]
+        return [m["content"] for m in self._window if m["role"] == "assistant"]
+    
+    def _push(self, role: str, content: str, timestamp: str = "") -> Dict[str, str]:
+        """Add a message to the in-memory window."""
+        message = {"role": role, "content": content}
+        self._llm_view.append(message)
+        self._timestamps.append(timestamp)
+        
+        # Slide the window: drop the oldest message after the system prompt
+        first = 1 if self._system_msg else 0
+        if len(self._llm_view) - first > self.max_history:
+            del self._llm_view[first]
+        return message
     
     def add_user_message(self, content: str) -> None:
         """Add a user message to history."""
-        self._messages.append({
-            "role": "user",
-            "content": content,
-            "timestamp": datetime.now().isoformat()
-        })
-        logger.debug(f"User: {content[:50]}...")
+        timestamp = datetime.now().isoformat()
+        message = self._push("user", content, timestamp)
+        self._user_count += 1
+        logger.debug("User: %.50s...", content)
         
         if self.persist:
-            self._auto_save()
+            self._append(message, timestamp)
     
     def add_assistant_message(self, content: str) -> None:
         """Add an assistant message to history."""
-        self._messages.append({
-            "role": "assistant",
-            "content": content,
-            "timestamp": datetime.now().isoformat()
-        })
-        logger.debug(f"Assistant: {content[:50]}...")
+        timestamp = datetime.now().isoformat()
+        message = self._push("assistant", content, timestamp)
+        self._assistant_count += 1
+        logger.debug("Assistant: %.50s...", content)
         
         if self.persist:
-            self._auto_save()
+            self._append(message, timestamp)
     
     def add_message(self, role: str, content: str) -> None:
         """Add a message with specified role."""
@@ -126,36 +282,250 @@ class ConversationManager:
         elif role == "assistant":
             self.add_assistant_message(content)
         else:
-            self._messages.append({"role": role, "content": content})
+            self._push(role, content)
     
     def clear_history(self, keep_system: bool = True) -> None:
         """Clear conversation history."""
-        if keep_system and self.system_prompt:
-            self._messages = [{
-                "role": "system",
-                "content": self.system_prompt
-            }]
-        else:
-            self._messages = []
+        if not keep_system:
+            self._system_msg = None
+        self._llm_view[:] = [self._system_msg] if self._system_msg else []
+        self._timestamps.clear()
+        self._user_count = 0
+        self._assistant_count = 0
+        
+        # The log keeps everything; full transcripts start from here
+        if self.persist:
+            self._cleared_offset = self._log_position()
+        
+        # Snapshot so the cleared history isn't replayed from the log
+        if self.persist and self._has_snapshot:
+            self._snapshot_requested = True
+            self._dirty = True
+            self._schedule_save()
         
         logger.info("Conversation history cleared")
     
     def get_context_summary(self) -> str:
         """Get a brief summary of the conversation context."""
-        user_count = len(self.user_messages)
-        assistant_count = len(self.assistant_messages)
-        return f"Session {self.session_id}: {user_count} user messages, {assistant_count} responses"
+        return f"Session {self.session_id}: {self._user_count} user messages, {self._assistant_count} responses"
+    
+    def _append(self, message: Dict[str, str], timestamp: str) -> None:
+        """Append a message to the session log and schedule a save."""
+        try:
+            if self._log_fh is None:
+                self._log_fh = open(self.log_path, 'ab')
+            
+            payload = _ENC.encode(Message(message["role"], message["content"], timestamp))
+            self._log_fh.write(_FRAME_HEADER.pack(len(payload)) + payload)
+            self._unsnapshotted += 1
+        except Exception as e:
+            logger.warning(f"Failed to append to conversation log: {e}")
+            return
+        
+        self._dirty = True
+        self._schedule_save()
+    
+    @property
+    def _snapshot_due(self) -> bool:
+        """Whether the next save should also write a full snapshot."""
+        # First message makes the session visible to list_sessions()
+        return (
+            self._snapshot_requested
+            or not self._has_snapshot
+            or self._unsnapshotted >= self.snapshot_interval
+        )
+    
+    def _schedule_save(self) -> None:
+        """
+        Save pending changes, coalescing all messages of a turn into one write.
+        
+        Inside a running event loop a debounced task is scheduled so disk
+        I/O doesn't block the loop; otherwise the save happens inline.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        
+        if loop is None:
+            self._dirty = False
+            self.flush()
+            if self._snapshot_due:
+                self._auto_save()
+            else:
+                self._save_header()
+            return
+        
+        if self._save_task is None or self._save_task.done():
+            self._save_now.clear()
+            self._save_task = loop.create_task(self._debounced_save())
+    
+    async def _debounced_save(self) -> None:
+        """Wait for the debounce window (or flush_pending), then save once."""
+        try:
+            await asyncio.wait_for(self._save_now.wait(), timeout=self.SAVE_DEBOUNCE)
+        except asyncio.TimeoutError:
+            pass
+        
+        # Messages added while saving are picked up by another pass
+        while self._dirty:
+            self._dirty = False
+            self.flush()
+            try:
+                if self._snapshot_due:
+                    await self.save_async()
+                else:
+                    await self._write_atomic_async(self.meta_path, self._current_header())
+            except Exception as e:
+                logger.warning(f"Auto-save failed: {e}")
+    
+    def _save_header(self) -> None:
+        """Refresh the listing sidecar between snapshots, logging on failure."""
+        try:
+            self._write_atomic(self.meta_path, self._current_header())
+        except Exception as e:
+            logger.warning(f"Auto-save failed: {e}")
     
     def _auto_save(self) -> None:
-        """Auto-save on each message if persistence is enabled."""
+        """Write a snapshot, logging instead of raising on failure."""
         try:
             self.save()
         except Exception as e:
             logger.warning(f"Auto-save failed: {e}")
     
+    async def flush_pending(self) -> None:
+        """Skip the debounce window and wait for pending writes to finish."""
+        if self._save_task is not None and not self._save_task.done():
+            self._save_now.set()
+            await self._save_task
+    
+    def flush(self) -> None:
+        """Flush buffered log frames to disk."""
+        if self._log_fh is not None:
+            try:
+                self._log_fh.flush()
+            except Exception as e:
+                logger.warning(f"Failed to flush conversation log: {e}")
+    
+    def close(self) -> None:
+        """Write a final snapshot and close the session log."""
+        if self._save_task is not None and not self._save_task.done():
+            self._save_task.cancel()
+        
+        self.flush()
+        if self.persist and (self._unsnapshotted or self._snapshot_requested):
+            try:
+                self.save()
+            except Exception as e:
+                logger.warning(f"Final save failed: {e}")
+        
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
+    
+    def _log_position(self) -> int:
+        """Current end of the session log, in bytes."""
+        if self._log_fh is not None:
+            self._log_fh.flush()
+            return self._log_fh.tell()
+        return self.log_path.stat().st_size if self.log_path.exists() else 0
+    
+    def _snapshot(self) -> Session:
+        """Build a session snapshot covering everything logged so far."""
+        session = Session(
+            session_id=self.session_id,
+            created_at=self.created_at.isoformat(),
+            updated_at=datetime.now().isoformat(),
+            system_prompt=self.system_prompt,
+            messages=[
+                Message(m["role"], m["content"], timestamp)
+                for m, timestamp in zip(self._window, self._timestamps)
+            ],
+            metadata={
+                "user_message_count": self._user_count,
+                "assistant_message_count": self._assistant_count
+            },
+            log_offset=self._log_position(),
+            cleared_offset=self._cleared_offset
+        )
+        return session
+    
+    @staticmethod
+    def _temp_path(save_path: Path) -> Path:
+        """Unique temp path next to save_path (concurrent saves never collide)."""
+        return save_path.with_name(f"{save_path.name}.{secrets.token_hex(4)}.tmp")
+    
+    @staticmethod
+    def _encode_header(session: Session) -> bytes:
+        """Encode the sidecar header for a session."""
+        return _ENC.encode(SessionHeader(
+            session_id=session.session_id,
+            created_at=session.created_at,
+            updated_at=session.updated_at,
+            metadata=session.metadata
+        ))
+    
+    def _current_header(self) -> bytes:
+        """
+        Encode the sidecar header for the live session.
+        
+        Rewritten on every save (it is tiny), so list_sessions sees current
+        counts and ordering even between full snapshots.
+        """
+        return _ENC.encode(SessionHeader(
+            session_id=self.session_id,
+            created_at=self.created_at.isoformat(),
+            updated_at=datetime.now().isoformat(),
+            metadata={
+                "user_message_count": self._user_count,
+                "assistant_message_count": self._assistant_count
+            }
+        ))
+    
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        """Write via a temp file so a crash never leaves a torn file."""
+        tmp_path = self._temp_path(path)
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    
+    async def _write_atomic_async(self, path: Path, data: bytes) -> None:
+        """Async version of _write_atomic()."""
+        tmp_path = self._temp_path(path)
+        async with aiofiles.open(tmp_path, 'wb') as f:
+            await f.write(data)
+        await aiofiles.os.replace(tmp_path, path)
+    
     def save(self, path: Optional[str] = None) -> str:
         """
-        Save conversation to JSON file.
+        Save conversation to a msgpack file.
+        
+        Args:
+            path: Custom save path (None = use default); a .json path
+                writes human-readable indented JSON instead
+        
+        Returns:
+            Path to saved file
+        """
+        save_path = Path(path) if path else self.snapshot_path
+        covered = self._unsnapshotted
+        session = self._snapshot()
+        
+        save_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_atomic(save_path, _encode_session(session, save_path))
+        
+        if not path:
+            self._write_atomic(self.meta_path, self._encode_header(session))
+            self._has_snapshot = True
+            self._snapshot_requested = False
+            self._unsnapshotted -= covered
+        
+        logger.debug("Conversation saved: %s", save_path)
+        return str(save_path)
+    
+    async def save_async(self, path: Optional[str] = None) -> str:
+        """
+        Async version of save() that keeps file I/O off the event loop.
         
         Args:
             path: Custom save path (None = use default)
@@ -163,38 +533,28 @@ class ConversationManager:
         Returns:
             Path to saved file
         """
-        if path:
-            save_path = Path(path)
-        else:
-            save_path = self.persist_path / f"{self.session_id}.json"
-        
-        data = {
-            "session_id": self.session_id,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": datetime.now().isoformat(),
-            "system_prompt": self.system_prompt,
-            "messages": [
-                {k: v for k, v in m.items() if k != "timestamp"} 
-                for m in self._messages if m["role"] != "system"
-            ],
-            "metadata": {
-                "user_message_count": len(self.user_messages),
-                "assistant_message_count": len(self.assistant_messages)
-            }
-        }
+        save_path = Path(path) if path else self.snapshot_path
+        covered = self._unsnapshotted
+        session = self._snapshot()
         
         save_path.parent.mkdir(parents=True, exist_ok=True)
+        await self._write_atomic_async(save_path, _encode_session(session, save_path))
         
-        with open(save_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if not path:
+            await self._write_atomic_async(self.meta_path, self._encode_header(session))
+            self._has_snapshot = True
+            self._snapshot_requested = False
+            self._unsnapshotted -= covered
         
-        logger.debug(f"Conversation saved: {save_path}")
+        logger.debug("Conversation saved: %s", save_path)
         return str(save_path)
     
     @classmethod
     def load(cls, path: str) -> 'ConversationManager':
         """
-        Load conversation from JSON file.
+        Load conversation from a saved session file.
+        
+        Messages logged after the snapshot are replayed from the session log.
         
         Args:
             path: Path to conversation file
@@ -202,23 +562,80 @@ class ConversationManager:
         Returns:
             Loaded ConversationManager instance
         """
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        session = cls._read(Path(path))
         
         # Create instance
         manager = cls(
-            system_prompt=data.get("system_prompt"),
-            session_id=data.get("session_id"),
-            persist=True
+            system_prompt=session.system_prompt,
+            session_id=session.session_id,
+            persist=True,
+            persist_path=str(Path(path).parent)
         )
+        # Sessions loaded from elsewhere (e.g. legacy JSON) get a fresh snapshot
+        manager._has_snapshot = manager.snapshot_path == Path(path)
         
-        # Restore messages
-        for msg in data.get("messages", []):
-            manager.add_message(msg["role"], msg["content"])
+        if session.created_at:
+            manager.created_at = datetime.fromisoformat(session.created_at)
+        
+        # Restore messages directly (no re-logging per restored message)
+        for msg in session.messages:
+            manager._push(msg.role, msg.content, msg.timestamp)
+        manager._user_count = session.metadata.get("user_message_count", 0)
+        manager._assistant_count = session.metadata.get("assistant_message_count", 0)
+        manager._cleared_offset = session.cleared_offset
         
         logger.info(f"Conversation loaded: {path}")
         return manager
     
+    @staticmethod
+    def read_session(path: str) -> Dict[str, Any]:
+        """
+        Read a saved session file as plain data (e.g. for the web API).
+        
+        Args:
+            path: Path to conversation file
+        
+        Returns:
+            Session as a dict of builtin types, with the full transcript
+        """
+        path = Path(path)
+        session = ConversationManager._read(path)
+        
+        # Snapshots only hold the recent window; the log has every message
+        # (unless the session was migrated from a file without a log)
+        log_path = path.with_suffix(LOG_SUFFIX)
+        if log_path.exists():
+            transcript = _read_log(log_path, session.cleared_offset)
+            total = (
+                session.metadata.get("user_message_count", 0)
+                + session.metadata.get("assistant_message_count", 0)
+            )
+            if len(transcript) >= total:
+                session.messages = transcript
+        
+        data = msgspec.to_builtins(session)
+        
+        # Log bookkeeping is internal, not part of the session's API shape
+        del data["log_offset"], data["cleared_offset"]
+        return data
+    
+    @staticmethod
+    def _read(path: Path) -> Session:
+        """Decode a snapshot and append any messages logged after it."""
+        session = _decode_session(path)
+        
+        log_path = path.with_suffix(LOG_SUFFIX)
+        tail = _read_log(log_path, session.log_offset)
+        session.messages.extend(tail)
+        
+        # Keep the counts in step with the replayed messages
+        for msg in tail:
+            if msg.role in ("user", "assistant"):
+                key = f"{msg.role}_message_count"
+                session.metadata[key] = session.metadata.get(key, 0) + 1
+        
+        return session
+    
     @classmethod
     def list_sessions(cls, persist_path: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -230,29 +647,94 @@ class ConversationManager:
         Returns:
             List of session info dicts
         """
+        return list(cls._listing(persist_path)[0])
+    
+    @classmethod
+    def find_session(
+        cls,
+        session_id: str,
+        persist_path: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a saved session's info by ID.
+        
+        Args:
+            session_id: Session to find
+            persist_path: Path to search for sessions
+        
+        Returns:
+            Session info dict, or None if not found
+        """
+        return cls._listing(persist_path)[1].get(session_id)
+    
+    @classmethod
+    def _listing(
+        cls,
+        persist_path: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """Session infos and an index by ID, rescanned only when the directory changes."""
         config = Config()
         path = Path(persist_path or config.conversations_path)
         
-        if not path.exists():
-            return []
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            return [], {}
+        
+        key = str(path.resolve())
+        cached = _listing_cache.get(key)
+        if cached and cached[0] == mtime:
+            return cached[1], cached[2]
+        
+        sessions = cls._scan_sessions(path)
+        by_id: Dict[str, Dict[str, Any]] = {}
+        for session in sessions:
+            by_id.setdefault(session["session_id"], session)  # Newest wins
+        _listing_cache[key] = (mtime, sessions, by_id)
+        return sessions, by_id
+    
+    @staticmethod
+    def _scan_sessions(path: Path) -> List[Dict[str, Any]]:
+        """Read session infos from a directory, newest first."""
+        # One directory scan, keeping the cheapest file to read per session:
+        # header sidecar, then snapshot, then legacy JSON
+        chosen: Dict[str, os.DirEntry] = {}
+        with os.scandir(path) as entries:
+            for entry in entries:
+                stem, suffix = os.path.splitext(entry.name)
+                if suffix not in _LISTING_ORDER:
+                    continue
+                current = chosen.get(stem)
+                if current is None:
+                    chosen[stem] = entry
+                elif _LISTING_ORDER[suffix] < _LISTING_ORDER[os.path.splitext(current.name)[1]]:
+                    chosen[stem] = entry
+        
+        # Newest first, ordered by mtime so sorting needs no decoding
+        ordered = sorted(chosen.values(), key=lambda e: e.stat().st_mtime, reverse=True)
         
         sessions = []
-        for file in path.glob("*.json"):
+        for entry in ordered:
+            file = Path(entry.path)
             try:
-                with open(file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    sessions.append({
-                        "session_id": data.get("session_id"),
-                        "created_at": data.get("created_at"),
-                        "updated_at": data.get("updated_at"),
-                        "message_count": data.get("metadata", {}).get("user_message_count", 0),
-                        "path": str(file)
-                    })
+                if file.suffix == META_SUFFIX:
+                    with open(file, 'rb') as f:
+                        header = _HEADER_DEC.decode(f.read())
+                    file = file.with_suffix(SESSION_SUFFIX)
+                else:
+                    header = _decode_session(file, header_only=True)
             except Exception as e:
                 logger.warning(f"Failed to read session file {file}: {e}")
+                continue
+            
+            sessions.append({
+                "session_id": header.session_id,
+                "created_at": header.created_at,
+                "updated_at": header.updated_at,
+                "message_count": header.metadata.get("user_message_count", 0),
+                "path": str(file)
+            })
         
-        # Sort by updated_at descending
-        sessions.sort(key=lambda x: x.get("updated_at", ""), reverse=True)
         return sessions
     
     @classmethod
@@ -265,8 +747,8 @@ class ConversationManager:
         return None
     
     def __len__(self) -> int:
-        """Number of messages (excluding system)."""
-        return len([m for m in self._messages if m["role"] != "system"])
+        """Number of user and assistant messages in the session."""
+        return self._user_count + self._assistant_count
     
     def __repr__(self) -> str:
         return f"ConversationManager(session={self.session_id}, messages={len(self)})"
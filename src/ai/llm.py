@@ -4,14 +4,23 @@ Handles communication with GPT models.
 """
 
 import os
-from typing import Optional, AsyncGenerator, List, Dict, Any
-from openai import OpenAI, AsyncOpenAI
+from functools import cached_property
+from typing import Optional, AsyncGenerator, List, Dict, Any, Sequence
+import httpx
+from openai import OpenAI, AsyncOpenAI, DefaultAsyncHttpxClient
 
 from ..core.logger import get_logger
 from ..core.config import Config
 
 logger = get_logger("nova.ai.llm")
 
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
 
 class LLMClient:
     """
@@ -49,15 +58,26 @@ class LLMClient:
         self.max_tokens = max_tokens
         self.temperature = temperature
         
-        # Initialize clients
-        self._client = OpenAI(api_key=self.api_key)
-        self._async_client = AsyncOpenAI(api_key=self.api_key)
+        # Async client is the hot path: keep connections alive across turns
+        # so each request skips the TCP + TLS handshake
+        self._async_client = AsyncOpenAI(
+            api_key=self.api_key,
+            http_client=DefaultAsyncHttpxClient(
+                http2=HAS_HTTP2,
+                limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60)
+            )
+        )
         
-        logger.debug(f"LLM client initialized: model={model}")
+        logger.debug(f"LLM client initialized: model={model}, http2={HAS_HTTP2}")
+    
+    @cached_property
+    def _client(self) -> OpenAI:
+        """Sync client, only created if chat()/stream_chat_sync() are used."""
+        return OpenAI(api_key=self.api_key)
     
     def chat(
         self,
-        messages: List[Dict[str, str]],
+        messages: Sequence[Dict[str, str]],
         stream: bool = False
     ) -> str:
         """
@@ -80,7 +100,7 @@ class LLMClient:
             )
             
             reply = response.choices[0].message.content
-            logger.debug(f"LLM response: {reply[:50]}...")
+            logger.debug("LLM response: %.50s...", reply)
             return reply
             
         except Exception as e:
@@ -89,7 +109,7 @@ class LLMClient:
     
     async def chat_async(
         self,
-        messages: List[Dict[str, str]]
+        messages: Sequence[Dict[str, str]]
     ) -> str:
         """Async version of chat()."""
         try:
@@ -101,7 +121,7 @@ class LLMClient:
             )
             
             reply = response.choices[0].message.content
-            logger.debug(f"LLM response: {reply[:50]}...")
+            logger.debug("LLM response: %.50s...", reply)
             return reply
             
         except Exception as e:
@@ -110,7 +130,7 @@ class LLMClient:
     
     async def stream_chat(
         self,
-        messages: List[Dict[str, str]]
+        messages: Sequence[Dict[str, str]]
     ) -> AsyncGenerator[str, None]:
         """
         Stream chat response token by token.
@@ -140,7 +160,7 @@ class LLMClient:
     
     def stream_chat_sync(
         self,
-        messages: List[Dict[str, str]]
+        messages: Sequence[Dict[str, str]]
     ):
         """
         Synchronous streaming (generator).
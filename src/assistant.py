@@ -4,19 +4,28 @@ Connects all components and runs the main interaction loop.
 """
 
 import asyncio
+import contextlib
 import sys
 import signal
-from typing import Optional
+from functools import cached_property
+from typing import Optional, TYPE_CHECKING
 from pathlib import Path
 
 from .core.config import Config
 from .core.logger import setup_logger, get_logger
-from .audio.recorder import AudioRecorder
-from .audio.stt import SpeechToText
-from .audio.tts import TextToSpeech
-from .audio.wake_word import WakeWordDetector, PushToTalk
-from .ai.llm import LLMClient
-from .ai.conversation import ConversationManager
+
+# Components are imported lazily so unused ones (and Whisper) never load
+if TYPE_CHECKING:
+    from .audio.recorder import AudioRecorder
+    from .audio.stt import SpeechToText
+    from .audio.tts import TextToSpeech
+    from .audio.wake_word import WakeWordDetector, PushToTalk
+    from .ai.llm import LLMClient
+    from .ai.conversation import ConversationManager
+
+# Spoken commands (matched against the normalized transcript)
+EXIT_COMMANDS = frozenset({"exit", "quit", "stop", "goodbye", "bye", "arrête", "au revoir"})
+STOP_COMMANDS = frozenset({"stop", "arrête", "tais-toi", "shut up"})
 
 
 class VoiceAssistant:
@@ -39,137 +48,197 @@ class VoiceAssistant:
         
         self.logger.info(f"🚀 Initializing {self.config.assistant_name}...")
         
-        # Initialize components
-        self._init_audio()
-        self._init_ai()
-        
         # State
         self._running = False
         self._listening = False
         
         self.logger.info(f"✅ {self.config.assistant_name} is ready!")
     
-    def _init_audio(self) -> None:
-        """Initialize audio components."""
-        # Recorder
-        self.recorder = AudioRecorder(
+    @cached_property
+    def recorder(self) -> "AudioRecorder":
+        """Microphone recorder (created on first use)."""
+        from .audio.recorder import AudioRecorder
+        return AudioRecorder(
             sample_rate=self.config.sample_rate,
             silence_duration=self.config.silence_duration
         )
-        
-        # Speech-to-text
-        self.stt = SpeechToText(
+    
+    @cached_property
+    def stt(self) -> "SpeechToText":
+        """Speech-to-text (created on first use)."""
+        from .audio.stt import SpeechToText
+        return SpeechToText(
             model=self.config.whisper_model,
             device=self.config.whisper_device,
-            languages=self.config.languages
+            languages=self.config.languages,
+            compute_type=self.config.whisper_compute_type
         )
-        
-        # Text-to-speech
-        self.tts = TextToSpeech(
+    
+    @cached_property
+    def tts(self) -> "TextToSpeech":
+        """Text-to-speech (created on first use)."""
+        from .audio.tts import TextToSpeech
+        return TextToSpeech(
             voice_en=self.config.tts_voice_en,
             voice_fr=self.config.tts_voice_fr,
             rate=self.config.tts_rate
         )
-        
-        # Wake word (optional)
+    
+    @cached_property
+    def wake_word(self) -> Optional["WakeWordDetector"]:
+        """Wake word detector, or None without a Porcupine key."""
         porcupine_key = self.config.get("porcupine", "access_key")
-        if porcupine_key:
-            self.wake_word = WakeWordDetector(
-                access_key=porcupine_key,
-                keyword="computer",  # Built-in closest to "hey nova"
-                sensitivity=0.5
-            )
-        else:
-            self.wake_word = None
-            self.push_to_talk = PushToTalk()
+        if not porcupine_key:
+            return None
+        
+        from .audio.wake_word import WakeWordDetector
+        return WakeWordDetector(
+            access_key=porcupine_key,
+            keyword="computer",  # Built-in closest to "hey nova"
+            sensitivity=0.5
+        )
     
-    def _init_ai(self) -> None:
-        """Initialize AI components."""
-        # LLM client
-        self.llm = LLMClient(
+    @cached_property
+    def push_to_talk(self) -> "PushToTalk":
+        """Push-to-talk fallback (created on first use)."""
+        from .audio.wake_word import PushToTalk
+        return PushToTalk()
+    
+    @cached_property
+    def llm(self) -> "LLMClient":
+        """LLM client (created on first use)."""
+        from .ai.llm import LLMClient
+        return LLMClient(
             model=self.config.openai_model,
             max_tokens=self.config.get("openai", "max_tokens", default=500),
             temperature=self.config.get("openai", "temperature", default=0.7)
         )
-        
-        # Conversation manager
-        self.conversation = ConversationManager(
+    
+    @cached_property
+    def conversation(self) -> "ConversationManager":
+        """Conversation manager (created on first use)."""
+        from .ai.conversation import ConversationManager
+        return ConversationManager(
             system_prompt=self.config.system_prompt,
             max_history=self.config.max_history,
             persist=self.config.persist_conversations
         )
     
-    async def _process_speech(self) -> None:
-        """Record, transcribe, and respond to user speech."""
-        self._listening = True
-        
-        # Show we're listening
-        print("\n🎤 Listening...")
-        
-        # Record audio
-        audio = self.recorder.record(
-            max_duration=15.0,
-            on_speech_start=lambda: print("💬 Speech detected..."),
-            on_speech_end=lambda: print("⏳ Processing...")
-        )
-        
-        self._listening = False
-        
-        if not audio:
-            self.logger.warning("No audio captured")
-            return
-        
-        # Transcribe
-        text, lang = self.stt.transcribe(audio)
-        
-        if not text or len(text.strip()) < 2:
-            print("❌ Could not understand, please try again.")
-            return
-        
-        print(f"📝 You: {text}")
-        
-        # Check for exit commands
-        exit_commands = ["exit", "quit", "stop", "goodbye", "bye", "arrête", "au revoir"]
-        if text.lower().strip() in exit_commands:
-            await self._say_goodbye(lang)
-            self.stop()
-            return
-        
-        # Check for stop speaking command
-        if text.lower().strip() in ["stop", "arrête", "tais-toi", "shut up"]:
-            self.tts.stop()
-            return
-        
+    def _is_created(self, name: str) -> bool:
+        """Whether a lazy component has been created yet."""
+        return name in self.__dict__
+    
+    async def _record_stage(self, activations: asyncio.Queue, audio_out: asyncio.Queue) -> None:
+        """Record an utterance for each activation (wake word or Enter)."""
+        try:
+            while self._running and await activations.get():
+                print("\n🎤 Listening...")
+                
+                # Recording blocks, so it runs off the loop; a reply may still be playing
+                self._listening = True
+                audio = await asyncio.to_thread(
+                    self.recorder.record,
+                    max_duration=15.0,
+                    on_speech_start=lambda: print("💬 Speech detected..."),
+                    on_speech_end=lambda: print("⏳ Processing...")
+                )
+                self._listening = False
+                
+                if not audio:
+                    self.logger.warning("No audio captured")
+                    continue
+                
+                await audio_out.put(audio)
+        finally:
+            audio_out.put_nowait(None)
+    
+    async def _transcribe_stage(self, audio_in: asyncio.Queue, text_out: asyncio.Queue) -> None:
+        """Transcribe recorded audio and pass (text, lang, command) on."""
+        try:
+            while (audio := await audio_in.get()) is not None:
+                text, lang = await asyncio.to_thread(self.stt.transcribe, audio)
+                
+                if not text or len(text.strip()) < 2:
+                    print("❌ Could not understand, please try again.")
+                    continue
+                
+                print(f"📝 You: {text}")
+                
+                command = text.strip().lower()
+                
+                # Stop speaking right away, even mid-reply
+                if command in STOP_COMMANDS and command not in EXIT_COMMANDS:
+                    self.tts.stop()
+                    continue
+                
+                await text_out.put((text, lang, command))
+        finally:
+            text_out.put_nowait(None)
+    
+    async def _respond_stage(self, text_in: asyncio.Queue) -> None:
+        """Answer each transcript, speaking the reply as it streams in."""
+        while (item := await text_in.get()) is not None:
+            text, lang, command = item
+            
+            # Check for exit commands (command was normalized when transcribed)
+            if command in EXIT_COMMANDS:
+                await self._say_goodbye(lang)
+                self.stop()
+                return
+            
+            await self._respond(text, lang)
+    
+    async def _respond(self, text: str, lang: str) -> None:
+        """Get an LLM reply to the user's text and speak it."""
         # Add to conversation
         self.conversation.add_user_message(text)
         
         # Get LLM response
         print("🤔 Thinking...")
         
-        response = ""
-        async for chunk in self.llm.stream_chat(self.conversation.messages_for_llm):
-            response += chunk
-            print(chunk, end="", flush=True)
+        # Speak each sentence as soon as it's complete while tokens keep
+        # streaming in (the producer never waits on playback)
+        parts = []
+        chunks: asyncio.Queue = asyncio.Queue()
+        
+        async def produce() -> None:
+            try:
+                async for chunk in self.llm.stream_chat(self.conversation.messages_for_llm):
+                    parts.append(chunk)
+                    print(chunk, end="", flush=True)
+                    chunks.put_nowait(chunk)
+            finally:
+                chunks.put_nowait(None)
+        
+        async def consume():
+            while (chunk := await chunks.get()) is not None:
+                yield chunk
+        
+        producer = asyncio.create_task(produce())
+        try:
+            await self.tts.speak_streaming(consume(), lang=lang)
+            await producer
+        finally:
+            # If the turn is cancelled (shutdown), stop streaming from the LLM too
+            producer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await producer
         
         print()  # New line after response
         
         # Add response to conversation
+        response = "".join(parts)
         self.conversation.add_assistant_message(response)
         
-        # Speak response
-        await self.tts.speak(response, lang=lang, wait=True)
+        # Let any snapshot scheduled during the turn finish
+        await self.conversation.flush_pending()
     
     async def _say_goodbye(self, lang: str = "en") -> None:
         """Say goodbye before exiting."""
         if lang.startswith("fr"):
-            await self.tts.speak("Au revoir! À bientôt!", lang="fr")
+            await self.tts.speak("Au revoir! À bientôt!", lang="fr", cache=True)
         else:
-            await self.tts.speak("Goodbye! Have a great day!", lang="en")
-    
-    async def _on_wake_word(self) -> None:
-        """Called when wake word is detected."""
-        self.logger.info("Wake word detected!")
-        await self._process_speech()
+            await self.tts.speak("Goodbye! Have a great day!", lang="en", cache=True)
     
     def _on_interrupt(self) -> None:
         """Handle keyboard interrupt."""
@@ -192,29 +261,54 @@ class VoiceAssistant:
         print("  Say 'exit' or 'quit' to stop")
         print(f"{'='*50}\n")
         
+        # Fail fast (e.g. missing API key) before greeting
+        self.llm
+        
+        # Whisper starts loading in the background while we greet
+        self.stt
+        
         # Greet user
-        await self.tts.speak(f"Hello! I'm {self.config.assistant_name}. How can I help you?", lang="en")
+        await self.tts.speak(f"Hello! I'm {self.config.assistant_name}. How can I help you?", lang="en", cache=True)
+        
+        # Activations (wake word or Enter) come from a listener thread;
+        # False means stdin was closed
+        loop = asyncio.get_running_loop()
+        activations: asyncio.Queue = asyncio.Queue()
+        
+        def activate(value: bool = True) -> None:
+            loop.call_soon_threadsafe(activations.put_nowait, value)
+        
+        # Record -> transcribe -> respond run concurrently, so the next
+        # utterance can be recorded and transcribed while a reply is spoken
+        audio: asyncio.Queue = asyncio.Queue()
+        transcripts: asyncio.Queue = asyncio.Queue()
+        stages = [
+            asyncio.create_task(self._record_stage(activations, audio)),
+            asyncio.create_task(self._transcribe_stage(audio, transcripts)),
+            asyncio.create_task(self._respond_stage(transcripts)),
+        ]
         
         try:
             if self.wake_word and self.wake_word.is_available:
-                # Wake word mode
-                self.wake_word.start(lambda: asyncio.create_task(self._on_wake_word()))
-                
-                while self._running:
-                    await asyncio.sleep(0.1)
+                self.wake_word.start(activate)
             else:
-                # Push-to-talk mode
-                while self._running:
-                    try:
-                        await asyncio.get_event_loop().run_in_executor(None, input)
-                        if self._running:
-                            await self._process_speech()
-                    except EOFError:
-                        break
-                        
+                self.push_to_talk.start(activate, on_eof=lambda: activate(False))
+            
+            # Ends on an exit command or once stdin closes and the pipeline
+            # drains; a stage failing ends it too, with that stage's error
+            pending = set(stages)
+            while stages[-1] in pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for stage in done:
+                    if not stage.cancelled() and stage.exception():
+                        raise stage.exception()
+        
         except KeyboardInterrupt:
             self._on_interrupt()
         finally:
+            for stage in stages:
+                stage.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
             self.cleanup()
     
     def run(self) -> None:
@@ -227,18 +321,29 @@ class VoiceAssistant:
     def stop(self) -> None:
         """Stop the assistant."""
         self._running = False
-        self.tts.stop()
         
-        if self.wake_word:
+        if self._is_created("recorder"):
+            self.recorder.stop()
+        
+        if self._is_created("tts"):
+            self.tts.stop()
+        
+        if self._is_created("wake_word") and self.wake_word:
             self.wake_word.stop()
+        
+        if self._is_created("push_to_talk"):
+            self.push_to_talk.stop()
     
     def cleanup(self) -> None:
         """Clean up resources."""
         self.stop()
         
-        if self.wake_word:
+        if self._is_created("wake_word") and self.wake_word:
             self.wake_word.cleanup()
         
+        if self._is_created("conversation"):
+            self.conversation.close()
+        
         self.logger.info("Assistant shut down")
     
     def test_microphone(self) -> None:
@@ -247,8 +352,10 @@ class VoiceAssistant:
         print(message)
         return success
     
-    def list_devices(self) -> None:
+    @staticmethod
+    def list_devices() -> None:
         """List available audio devices."""
+        from .audio.recorder import AudioRecorder
         devices = AudioRecorder.list_devices()
         
         print("\n📱 Available Audio Input Devices:")
@@ -265,6 +372,7 @@ class VoiceAssistant:
         print("\n🗣️ Available TTS Voices:")
         print("-" * 40)
         
+        from .audio.tts import TextToSpeech
         voices = await TextToSpeech.list_voices()
         
         current_lang = ""
@@ -1,4 +1,19 @@
 # Audio Module
-from .recorder import AudioRecorder
-from .stt import SpeechToText
-from .tts import TextToSpeech
+# Submodules are imported on first access, so using one component (e.g. the
+# recorder) doesn't pull in the others' heavy dependencies
+import importlib
+
+_EXPORTS = {
+    "AudioClip": ".clip",
+    "AudioRecorder": ".recorder",
+    "SpeechToText": ".stt",
+    "TextToSpeech": ".tts",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,39 @@
+"""
+In-memory audio clips passed between the recorder and speech-to-text.
+"""
+
+import io
+import wave
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class AudioClip:
+    """
+    Mono PCM16 audio.
+    
+    Kept as raw samples so STT can use them directly; WAV encoding only
+    happens when a file is actually needed.
+    """
+    
+    samples: np.ndarray  # int16, mono
+    sample_rate: int
+    
+    @property
+    def duration(self) -> float:
+        """Length of the clip in seconds."""
+        return len(self.samples) / self.sample_rate
+    
+    def to_wav_bytes(self) -> bytes:
+        """Encode the clip as a 16-bit mono WAV file."""
+        # wave accepts the array buffer without a copy
+        buffer = io.BytesIO()
+        with wave.open(buffer, 'wb') as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)  # 16-bit
+            wav_file.setframerate(self.sample_rate)
+            wav_file.writeframes(np.ascontiguousarray(self.samples, dtype=np.int16))
+        
+        return buffer.getvalue()
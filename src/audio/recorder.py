@@ -3,22 +3,53 @@ Audio recording with Voice Activity Detection.
 Records from microphone and auto-stops on silence.
 """
 
+import math
 import numpy as np
 import sounddevice as sd
 import soundfile as sf
 import webrtcvad
-import io
-import wave
 from pathlib import Path
 from typing import Optional, Tuple, List, Callable
 from collections import deque
 import threading
 import time
 
+from .clip import AudioClip
 from ..core.logger import get_logger
 
 logger = get_logger("nova.audio.recorder")
 
+# Scales int16 sample magnitudes to the 0.0 - 1.0 range
+INT16_SCALE = 1.0 / 32768
+
+# Level (see _level) above which a frame counts as speech without VAD, ~-40 dBFS
+SPEECH_LEVEL = 0.6
+
+# Energy gate in front of VAD: frames below ~-50 dBFS are silence and frames
+# above ~-25 dBFS are speech; only the band in between goes to webrtcvad
+NOISE_FLOOR_LEVEL = 0.5
+LOUD_LEVEL = 0.75
+
+# Frame formats accepted by webrtcvad
+VAD_SAMPLE_RATES = frozenset({8000, 16000, 32000, 48000})
+VAD_FRAME_MS = frozenset({10, 20, 30})
+
+
+def _level(samples: np.ndarray) -> float:
+    """
+    Audio level of int16 samples as RMS dBFS mapped from -100..0 to 0.0 - 1.0.
+    
+    Args:
+        samples: int16 audio samples
+    
+    Returns:
+        Level between 0.0 (silence) and 1.0 (full scale)
+    """
+    x = samples.astype(np.float32)
+    rms = math.sqrt(float(np.dot(x, x)) / len(x)) if len(x) else 0.0
+    dbfs = 20 * math.log10(max(rms, 1e-9) * INT16_SCALE)  # Silence maps to 0.0
+    return max(0.0, min(1.0, (dbfs + 100) / 100))
+
 
 class AudioRecorder:
     """
@@ -58,9 +89,16 @@ class AudioRecorder:
         # Calculate frame size in samples
         self.frame_size = int(sample_rate * frame_duration_ms / 1000)
         
+        # webrtcvad only takes 10/20/30 ms frames at 8/16/32/48 kHz; check
+        # once here so the audio callback needs no try/except per frame
+        self._use_vad = sample_rate in VAD_SAMPLE_RATES and frame_duration_ms in VAD_FRAME_MS
+        if not self._use_vad:
+            logger.warning(f"VAD unsupported at {sample_rate}Hz/{frame_duration_ms}ms, using level threshold")
+        
         # Recording state
         self._is_recording = False
-        self._audio_buffer: List[bytes] = []
+        self._done = threading.Event()  # Set when the current recording ends
+        self._pcm = np.empty(0, dtype=np.int16)
         self._level_callback: Optional[Callable[[float], None]] = None
         
         logger.debug(f"AudioRecorder initialized: {sample_rate}Hz, VAD={vad_aggressiveness}")
@@ -104,7 +142,7 @@ class AudioRecorder:
         max_duration: float = 30.0,
         on_speech_start: Optional[Callable[[], None]] = None,
         on_speech_end: Optional[Callable[[], None]] = None
-    ) -> Optional[bytes]:
+    ) -> Optional[AudioClip]:
         """
         Record audio until silence is detected or max duration reached.
         
@@ -114,14 +152,14 @@ class AudioRecorder:
             on_speech_end: Callback when recording ends
         
         Returns:
-            WAV audio data as bytes, or None if cancelled
+            Recorded clip, or None if nothing was captured
         """
         if self._is_recording:
             logger.warning("Already recording")
             return None
         
         self._is_recording = True
-        self._audio_buffer = []
+        self._done.clear()
         
         # Tracking for VAD
         speech_started = False
@@ -130,32 +168,49 @@ class AudioRecorder:
         max_frames = int(max_duration * 1000 / self.frame_duration_ms)
         frame_count = 0
         
+        # Sized for max_duration up front so the callback never allocates
+        capacity = max_frames * self.frame_size
+        if len(self._pcm) < capacity:
+            self._pcm = np.empty(capacity, dtype=np.int16)
+        pcm_len = 0
+        
         logger.info("🎤 Recording started...")
         
+        # Bind everything the callback touches to locals once, so each
+        # 30 ms frame does fast local loads instead of attribute lookups
+        vad_is_speech = self.vad.is_speech if self._use_vad else None
+        sample_rate = self.sample_rate
+        level_callback = self._level_callback
+        pcm = self._pcm
+        done = self._done
+        
         try:
             def audio_callback(indata, frames, time_info, status):
-                nonlocal speech_started, silence_frames, frame_count
+                nonlocal speech_started, silence_frames, frame_count, pcm_len
                 
                 if status:
-                    logger.warning(f"Audio status: {status}")
+                    logger.warning("Audio status: %s", status)
                 
                 if not self._is_recording:
                     raise sd.CallbackAbort()
                 
-                # Convert to bytes for VAD
-                audio_int16 = (indata[:, 0] * 32767).astype(np.int16)
-                audio_bytes = audio_int16.tobytes()
+                # The stream already delivers PCM16, which VAD takes as-is
+                audio_int16 = indata[:, 0]
                 
-                # Calculate audio level
-                level = np.abs(indata).mean()
-                if self._level_callback:
-                    self._level_callback(min(level * 10, 1.0))
+                # Calculate audio level (0.0 - 1.0)
+                level = _level(audio_int16)
+                if level_callback:
+                    level_callback(level)
                 
-                # VAD check
-                try:
-                    is_speech = self.vad.is_speech(audio_bytes, self.sample_rate)
-                except Exception:
-                    is_speech = level > 0.01  # Fallback to simple threshold
+                # VAD check, skipped when the level alone is conclusive
+                if not vad_is_speech:
+                    is_speech = level > SPEECH_LEVEL  # Fallback to simple threshold
+                elif level < NOISE_FLOOR_LEVEL:
+                    is_speech = False
+                elif level > LOUD_LEVEL:
+                    is_speech = True
+                else:
+                    is_speech = vad_is_speech(audio_int16.tobytes(), sample_rate)
                 
                 if is_speech:
                     if not speech_started:
@@ -164,19 +219,25 @@ class AudioRecorder:
                         if on_speech_start:
                             on_speech_start()
                     silence_frames = 0
-                    self._audio_buffer.append(audio_bytes)
                 elif speech_started:
                     silence_frames += 1
-                    self._audio_buffer.append(audio_bytes)
                     
                     if silence_frames >= frames_for_silence:
                         logger.debug("Silence detected, stopping")
                         self._is_recording = False
+                        done.set()
+                
+                # Keep everything from the start of speech
+                if speech_started:
+                    end = min(pcm_len + len(audio_int16), capacity)
+                    pcm[pcm_len:end] = audio_int16[:end - pcm_len]
+                    pcm_len = end
                 
                 frame_count += 1
                 if frame_count >= max_frames:
                     logger.debug("Max duration reached")
                     self._is_recording = False
+                    done.set()
             
             # Start recording
             with sd.InputStream(
@@ -184,18 +245,18 @@ class AudioRecorder:
                 channels=self.channels,
                 samplerate=self.sample_rate,
                 blocksize=self.frame_size,
-                dtype=np.float32,
+                dtype=np.int16,
                 callback=audio_callback
             ):
-                while self._is_recording:
-                    sd.sleep(100)
+                # Woken by the callback (silence / max duration) or stop()
+                done.wait(timeout=max_duration + 1.0)
             
             if on_speech_end:
                 on_speech_end()
             
-            # Convert to WAV
-            if self._audio_buffer:
-                return self._create_wav(self._audio_buffer)
+            # Copied out since the buffer is reused by the next recording
+            if pcm_len:
+                return AudioClip(pcm[:pcm_len].copy(), self.sample_rate)
             else:
                 logger.warning("No audio captured")
                 return None
@@ -209,27 +270,13 @@ class AudioRecorder:
     def stop(self) -> None:
         """Stop the current recording."""
         self._is_recording = False
+        self._done.set()
         logger.debug("Recording stopped by request")
     
-    def _create_wav(self, audio_chunks: List[bytes]) -> bytes:
-        """Convert audio chunks to WAV format."""
-        audio_data = b''.join(audio_chunks)
-        
-        # Create WAV in memory
-        buffer = io.BytesIO()
-        with wave.open(buffer, 'wb') as wav_file:
-            wav_file.setnchannels(self.channels)
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(self.sample_rate)
-            wav_file.writeframes(audio_data)
-        
-        buffer.seek(0)
-        return buffer.read()
-    
-    def save_wav(self, audio_data: bytes, path: str) -> None:
-        """Save audio data to a WAV file."""
+    def save_wav(self, clip: AudioClip, path: str) -> None:
+        """Save a recorded clip to a WAV file."""
         with open(path, 'wb') as f:
-            f.write(audio_data)
+            f.write(clip.to_wav_bytes())
         logger.debug(f"Audio saved to {path}")
     
     def test_microphone(self, duration: float = 3.0) -> Tuple[bool, str]:
@@ -252,7 +299,7 @@ class AudioRecorder:
                 device=self.device,
                 channels=self.channels,
                 samplerate=self.sample_rate,
-                dtype=np.float32,
+                dtype=np.int16,
                 callback=callback
             ):
                 sd.sleep(int(duration * 1000))
@@ -260,7 +307,7 @@ class AudioRecorder:
             if recorded:
                 # Calculate average level
                 all_audio = np.concatenate(recorded)
-                level = np.abs(all_audio).mean()
+                level = np.abs(all_audio, dtype=np.int32).mean() * INT16_SCALE
                 
                 if level < 0.001:
                     return False, "⚠️ Microphone detected but very quiet. Check input volume."
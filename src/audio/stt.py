@@ -1,41 +1,97 @@
 """
-Speech-to-Text using local OpenAI Whisper.
+Speech-to-Text using local Whisper (faster-whisper / CTranslate2).
 Runs entirely on your machine - no API calls, completely free.
 """
 
 import io
-import tempfile
 import os
-from pathlib import Path
-from typing import Optional, Tuple
+import threading
+from typing import BinaryIO, Optional, Tuple, Union
 import numpy as np
+import soundfile as sf
 
+from .clip import AudioClip
 from ..core.logger import get_logger
 
 logger = get_logger("nova.audio.stt")
 
+# Whisper works on 16 kHz mono float32 samples
+WHISPER_SAMPLE_RATE = 16000
+
+# detect_language classifies only this much of the audio
+DETECT_PREFIX_SECONDS = 3
+
+# Utterances shorter than this keep the last detected language
+STICKY_LANG_SECONDS = 1.5
+
+# Recorder clips, WAV bytes, or raw samples at 16 kHz
+AudioInput = Union[AudioClip, bytes, np.ndarray]
+
 # Lazy import whisper (it's heavy)
 _whisper_model = None
+_whisper_lock = threading.Lock()  # Background preload and first use may race
 
 
-def _load_whisper(model_name: str = "base", device: str = "cpu"):
+def _load_whisper(
+    model_name: str = "base",
+    device: str = "cpu",
+    compute_type: Optional[str] = None
+):
     """Load Whisper model (lazy loading to speed up startup)."""
     global _whisper_model
     
-    if _whisper_model is None:
-        logger.info(f"Loading Whisper model '{model_name}'... (first time may take a minute)")
-        
-        try:
-            import whisper
-            _whisper_model = whisper.load_model(model_name, device=device)
-            logger.info(f"✅ Whisper model loaded on {device}")
-        except Exception as e:
-            logger.error(f"Failed to load Whisper: {e}")
-            raise
+    with _whisper_lock:
+        if _whisper_model is None:
+            logger.info(f"Loading Whisper model '{model_name}'... (first time may take a minute)")
+            
+            try:
+                from faster_whisper import WhisperModel
+                
+                # int8 weights keep inference fast with near-identical accuracy
+                compute_type = compute_type or ("int8" if device == "cpu" else "int8_float16")
+                _whisper_model = WhisperModel(
+                    model_name,
+                    device=device,
+                    compute_type=compute_type,
+                    cpu_threads=max(1, (os.cpu_count() or 2) // 2),  # Leave room for audio/LLM
+                    num_workers=1
+                )
+                logger.info(f"✅ Whisper model loaded on {device} ({compute_type})")
+            except Exception as e:
+                logger.error(f"Failed to load Whisper: {e}")
+                raise
     
     return _whisper_model
 
 
+def _to_samples(audio: AudioInput) -> Union[np.ndarray, BinaryIO]:
+    """
+    Convert recorded audio into samples Whisper can take directly.
+    
+    Args:
+        audio: Recorded clip, WAV bytes, or int16/float32 samples at 16 kHz
+    
+    Returns:
+        float32 mono samples, or a file object if resampling is needed
+    """
+    if isinstance(audio, AudioClip):
+        if audio.sample_rate != WHISPER_SAMPLE_RATE:
+            return io.BytesIO(audio.to_wav_bytes())  # Let faster-whisper resample
+        audio = audio.samples
+    
+    if isinstance(audio, np.ndarray):
+        if audio.dtype == np.int16:
+            return audio.astype(np.float32) / 32768
+        return audio.astype(np.float32, copy=False)
+    
+    samples, sample_rate = sf.read(io.BytesIO(audio), dtype="float32")
+    if sample_rate != WHISPER_SAMPLE_RATE:
+        return io.BytesIO(audio)  # Let faster-whisper decode and resample
+    if samples.ndim > 1:
+        samples = samples.mean(axis=1)
+    return samples
+
+
 class SpeechToText:
     """
     Speech-to-text using local Whisper model.
@@ -62,7 +118,9 @@ class SpeechToText:
         self,
         model: str = "base",
         device: str = "cpu",
-        languages: Optional[list] = None
+        languages: Optional[list] = None,
+        compute_type: Optional[str] = None,
+        preload: bool = True
     ):
         """
         Initialize Speech-to-Text.
@@ -71,32 +129,59 @@ class SpeechToText:
             model: Whisper model size (tiny, base, small, medium, large)
             device: Device to run on ("cpu" or "cuda")
             languages: List of language codes to detect (None = auto-detect all)
+            compute_type: CTranslate2 compute type (None = int8 on CPU,
+                int8_float16 on GPU; e.g. "int8_float32" for a little more accuracy)
+            preload: Load and warm up the model in a background thread now
         """
         self.model_name = model
         self.device = device
+        self.compute_type = compute_type
         self.languages = languages or ["en", "fr"]
         
-        # Model is loaded lazily on first use
+        # Model is loaded in the background, or lazily on first use
         self._model = None
         
+        # (audio, samples, language) from the last detect_language call,
+        # so a following transcribe of the same audio skips both steps;
+        # language is None when it was only the sticky guess
+        self._detected: Optional[Tuple[AudioInput, np.ndarray, Optional[str]]] = None
+        
+        # Last language detected this session
+        self._sticky_lang: Optional[str] = None
+        
         logger.debug(f"STT initialized: model={model}, device={device}")
+        
+        if preload:
+            threading.Thread(target=self._preload, name="nova-stt-preload", daemon=True).start()
+    
+    def _preload(self) -> None:
+        """Load the model and run a short dummy transcription to warm it up."""
+        try:
+            model = self._ensure_model()
+            silence = np.zeros(WHISPER_SAMPLE_RATE // 2, dtype=np.float32)
+            segments, _ = model.transcribe(silence, beam_size=1, language="en")
+            for _ in segments:
+                pass
+            logger.debug("Whisper model warmed up")
+        except Exception as e:
+            logger.debug(f"Whisper preload failed: {e}")  # Retried on first use
     
     def _ensure_model(self):
         """Ensure Whisper model is loaded."""
         if self._model is None:
-            self._model = _load_whisper(self.model_name, self.device)
+            self._model = _load_whisper(self.model_name, self.device, self.compute_type)
         return self._model
     
     def transcribe(
         self,
-        audio_data: bytes,
+        audio_data: AudioInput,
         language: Optional[str] = None
     ) -> Tuple[str, str]:
         """
         Transcribe audio to text.
         
         Args:
-            audio_data: WAV audio data as bytes
+            audio_data: Recorded clip, WAV bytes, or 16 kHz samples
             language: Force specific language (None = auto-detect)
         
         Returns:
@@ -104,41 +189,36 @@ class SpeechToText:
         """
         model = self._ensure_model()
         
-        # Save to temp file (Whisper needs file path)
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            f.write(audio_data)
-            temp_path = f.name
-        
         try:
             logger.debug("Transcribing audio...")
             
-            # Transcribe
-            options = {
-                "fp16": False,  # CPU doesn't support fp16
-            }
-            
-            if language:
-                options["language"] = language
+            # Reuse the decode (and real detection) done by detect_language
+            cached = self._detected
+            self._detected = None
+            if cached and cached[0] is audio_data:
+                samples = cached[1]
+                language = language or cached[2]
+            else:
+                samples = _to_samples(audio_data)  # In memory, no temp file
             
-            result = model.transcribe(temp_path, **options)
+            segments, info = model.transcribe(
+                samples,
+                language=language,
+                beam_size=1,
+                vad_filter=True
+            )
             
-            text = result["text"].strip()
-            detected_lang = result.get("language", "en")
+            text = "".join(segment.text for segment in segments).strip()
+            detected_lang = info.language or "en"
+            self._sticky_lang = detected_lang
             
-            logger.info(f"📝 Transcribed ({detected_lang}): {text[:50]}...")
+            logger.info("📝 Transcribed (%s): %.50s...", detected_lang, text)
             
             return text, detected_lang
             
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             return "", "en"
-            
-        finally:
-            # Clean up temp file
-            try:
-                os.unlink(temp_path)
-            except:
-                pass
     
     def transcribe_file(self, file_path: str) -> Tuple[str, str]:
         """
@@ -155,12 +235,12 @@ class SpeechToText:
         try:
             logger.debug(f"Transcribing file: {file_path}")
             
-            result = model.transcribe(file_path, fp16=False)
+            segments, info = model.transcribe(file_path, beam_size=1, vad_filter=True)
             
-            text = result["text"].strip()
-            detected_lang = result.get("language", "en")
+            text = "".join(segment.text for segment in segments).strip()
+            detected_lang = info.language or "en"
             
-            logger.info(f"📝 Transcribed ({detected_lang}): {text[:50]}...")
+            logger.info("📝 Transcribed (%s): %.50s...", detected_lang, text)
             
             return text, detected_lang
             
@@ -168,49 +248,52 @@ class SpeechToText:
             logger.error(f"File transcription failed: {e}")
             return "", "en"
     
-    def detect_language(self, audio_data: bytes) -> str:
+    def detect_language(self, audio_data: AudioInput, force: bool = False) -> str:
         """
         Detect language of audio without full transcription.
         
+        Short utterances reuse the language already detected in this session,
+        and longer ones are classified from their first few seconds only.
+        
         Args:
-            audio_data: WAV audio data as bytes
+            audio_data: Recorded clip, WAV bytes, or 16 kHz samples
+            force: Always run detection over the whole clip
         
         Returns:
             Detected language code (e.g., "en", "fr")
         """
         model = self._ensure_model()
         
-        # Save to temp file
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            f.write(audio_data)
-            temp_path = f.name
-        
         try:
-            import whisper
+            samples = _to_samples(audio_data)
+            is_array = isinstance(samples, np.ndarray)
             
-            # Load audio
-            audio = whisper.load_audio(temp_path)
-            audio = whisper.pad_or_trim(audio)
+            if is_array and not force:
+                # Too short to classify reliably; assume the session language
+                if self._sticky_lang and len(samples) < STICKY_LANG_SECONDS * WHISPER_SAMPLE_RATE:
+                    # Don't force the guess on transcribe; Whisper detects there
+                    self._detected = (audio_data, samples, None)
+                    return self._sticky_lang
+                
+                prefix = samples[:DETECT_PREFIX_SECONDS * WHISPER_SAMPLE_RATE]
+            else:
+                prefix = samples
             
-            # Make log-Mel spectrogram
-            mel = whisper.log_mel_spectrogram(audio).to(model.device)
+            # Language is detected up front; segments are decoded lazily,
+            # so leaving the generator unconsumed skips transcription
+            _, info = model.transcribe(prefix, beam_size=1)
+            detected = info.language
+            self._sticky_lang = detected
             
-            # Detect language
-            _, probs = model.detect_language(mel)
-            detected = max(probs, key=probs.get)
+            if is_array:
+                self._detected = (audio_data, samples, detected)
             
-            logger.debug(f"Detected language: {detected}")
+            logger.debug("Detected language: %s", detected)
             return detected
             
         except Exception as e:
             logger.error(f"Language detection failed: {e}")
             return "en"
-            
-        finally:
-            try:
-                os.unlink(temp_path)
-            except:
-                pass
     
     @staticmethod
     def list_models() -> list:
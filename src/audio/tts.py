@@ -4,13 +4,16 @@ Free, high-quality neural voices with streaming support.
 """
 
 import asyncio
+import hashlib
 import io
-import tempfile
 import os
+import re
+import secrets
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, List, AsyncGenerator
+from typing import Any, Awaitable, Optional, List, AsyncGenerator
 import threading
-import queue
+import numpy as np
 
 from ..core.logger import get_logger
 
@@ -25,12 +28,49 @@ except ImportError:
     logger.warning("edge-tts not installed. TTS will not work.")
 
 try:
-    import pygame
-    pygame.mixer.init()
-    HAS_PYGAME = True
+    import sounddevice as sd
+    import soundfile as sf
+    HAS_PLAYBACK = True
 except Exception as e:
-    HAS_PYGAME = False
-    logger.warning(f"pygame audio not available: {e}")
+    HAS_PLAYBACK = False
+    logger.warning(f"Audio playback not available: {e}")
+
+# End of a sentence: terminator followed by whitespace, or a line break
+_SENTENCE_END = re.compile(r"[.!?;]\s|\n")
+
+# Sentences synthesized ahead of the one playing in speak_streaming
+STREAM_SYNTH_AHEAD = 2
+
+# Cache for fixed phrases (greetings, errors, previews) that callers opt
+# into with cache=True; conversation replies are never cached
+DEFAULT_CACHE_DIR = Path("~/.cache/nova/tts").expanduser()
+CACHE_MEMORY_ITEMS = 64
+CACHE_DISK_ITEMS = 128  # Least recently used files beyond this are deleted
+CACHE_MAX_CHARS = 200
+
+# Event loop shared by the *_sync wrappers, run in a daemon thread
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared background loop, starting it on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="nova-tts-loop", daemon=True).start()
+    return _loop
+
+
+def run_sync(coro: Awaitable[Any]) -> Any:
+    """
+    Run a coroutine on the shared background loop and wait for its result.
+    
+    Unlike asyncio.run(), the loop is kept between calls instead of being
+    created and torn down each time.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop()).result()
 
 
 class TextToSpeech:
@@ -61,7 +101,8 @@ class TextToSpeech:
         voice_en: str = "en-US-AriaNeural",
         voice_fr: str = "fr-FR-DeniseNeural",
         rate: str = "+0%",
-        volume: str = "+0%"
+        volume: str = "+0%",
+        cache_dir: Optional[Path] = DEFAULT_CACHE_DIR
     ):
         """
         Initialize TTS engine.
@@ -71,21 +112,86 @@ class TextToSpeech:
             voice_fr: Voice for French
             rate: Speech rate adjustment (-50% to +50%)
             volume: Volume adjustment (-50% to +50%)
+            cache_dir: Directory for cached audio (None = memory cache only)
         """
         self.voice_en = voice_en
         self.voice_fr = voice_fr
         self.rate = rate
         self.volume = volume
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        
+        # Most recently used clips, keyed by _cache_key
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
         
         self._is_speaking = False
         self._stop_event = threading.Event()
-        self._current_sound = None
+        self._stream = None  # Current sounddevice output stream
         
         if not HAS_EDGE_TTS:
             logger.error("edge-tts is required for TTS")
         
         logger.debug(f"TTS initialized: en={voice_en}, fr={voice_fr}")
     
+    def _cache_key(self, text: str, voice: str) -> str:
+        """Hash of everything that affects the synthesized audio."""
+        data = f"{voice}|{self.rate}|{self.volume}|{text}".encode("utf-8")
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+    
+    async def _cache_get(self, key: str) -> Optional[bytes]:
+        """Look up cached audio in memory, then on disk."""
+        audio = self._cache.get(key)
+        if audio is not None:
+            self._cache.move_to_end(key)
+            return audio
+        
+        if self.cache_dir:
+            audio = await asyncio.to_thread(self._disk_read, key)
+            if audio is not None:
+                self._cache_remember(key, audio)
+        return audio
+    
+    async def _cache_put(self, key: str, audio: bytes) -> None:
+        """Store audio in the memory cache and on disk."""
+        self._cache_remember(key, audio)
+        
+        if self.cache_dir:
+            await asyncio.to_thread(self._disk_write, key, audio)
+    
+    def _disk_read(self, key: str) -> Optional[bytes]:
+        """Read a cached clip, marking it as recently used (blocking)."""
+        path = self.cache_dir / f"{key}.mp3"
+        try:
+            audio = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        return audio
+    
+    def _disk_write(self, key: str, audio: bytes) -> None:
+        """Atomically write a clip, then evict the oldest beyond CACHE_DISK_ITEMS (blocking)."""
+        path = self.cache_dir / f"{key}.mp3"
+        tmp_path = path.with_name(f".{key}.{secrets.token_hex(4)}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(audio)
+            os.replace(tmp_path, path)
+            
+            with os.scandir(self.cache_dir) as entries:
+                files = [e for e in entries if e.name.endswith(".mp3")]
+            if len(files) > CACHE_DISK_ITEMS:
+                files.sort(key=lambda e: e.stat().st_mtime)
+                for entry in files[:len(files) - CACHE_DISK_ITEMS]:
+                    os.unlink(entry.path)
+        except OSError as e:
+            logger.debug(f"Could not write TTS cache: {e}")
+    
+    def _cache_remember(self, key: str, audio: bytes) -> None:
+        """Add audio to the in-memory LRU."""
+        self._cache[key] = audio
+        self._cache.move_to_end(key)
+        if len(self._cache) > CACHE_MEMORY_ITEMS:
+            self._cache.popitem(last=False)
+    
     def get_voice_for_language(self, lang: str) -> str:
         """Get appropriate voice for detected language."""
         if lang.startswith("fr"):
@@ -93,23 +199,36 @@ class TextToSpeech:
         else:
             return self.voice_en
     
-    async def synthesize(self, text: str, voice: Optional[str] = None) -> bytes:
+    async def synthesize(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+        cache: bool = False
+    ) -> bytes:
         """
         Synthesize text to audio.
         
         Args:
             text: Text to speak
             voice: Voice to use (None = use default English voice)
+            cache: Reuse/store the audio (only for fixed, repeated phrases)
         
         Returns:
             MP3 audio data as bytes
         """
+        voice = voice or self.voice_en
+        
+        # Fixed phrases are replayed without a network round trip
+        key = self._cache_key(text, voice) if cache and len(text) <= CACHE_MAX_CHARS else None
+        if key:
+            cached = await self._cache_get(key)
+            if cached:
+                return cached
+        
         if not HAS_EDGE_TTS:
             logger.error("edge-tts not available")
             return b""
         
-        voice = voice or self.voice_en
-        
         try:
             communicate = edge_tts.Communicate(
                 text=text,
@@ -124,7 +243,10 @@ class TextToSpeech:
                 if chunk["type"] == "audio":
                     audio_chunks.append(chunk["data"])
             
-            return b"".join(audio_chunks)
+            audio = b"".join(audio_chunks)
+            if key and audio:
+                await self._cache_put(key, audio)
+            return audio
             
         except Exception as e:
             logger.error(f"TTS synthesis failed: {e}")
@@ -134,7 +256,8 @@ class TextToSpeech:
         self,
         text: str,
         lang: str = "en",
-        wait: bool = True
+        wait: bool = True,
+        cache: bool = False
     ) -> None:
         """
         Speak text out loud.
@@ -143,50 +266,105 @@ class TextToSpeech:
             text: Text to speak
             lang: Language code (determines voice)
             wait: Whether to wait for speech to complete
+            cache: Reuse/store the audio (only for fixed, repeated phrases)
         """
-        if not HAS_PYGAME:
-            logger.error("pygame not available for audio playback")
+        if not HAS_PLAYBACK:
+            logger.error("sounddevice/soundfile not available for audio playback")
             return
         
         voice = self.get_voice_for_language(lang)
-        logger.info(f"🔊 Speaking ({lang}): {text[:50]}...")
+        logger.info("🔊 Speaking (%s): %.50s...", lang, text)
         
         # Synthesize
-        audio_data = await self.synthesize(text, voice)
+        audio_data = await self.synthesize(text, voice, cache)
         
         if not audio_data:
             return
         
-        # Play audio
         self._stop_event.clear()
+        await self._play_audio(audio_data, wait)
+    
+    async def _play_audio(self, audio_data: bytes, wait: bool) -> None:
+        """
+        Decode synthesized MP3 audio and play it.
+        
+        Args:
+            audio_data: MP3 audio data
+            wait: Whether to wait for playback to complete
+        """
         self._is_speaking = True
         
         try:
-            # Save to temp file for pygame
-            with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
-                f.write(audio_data)
-                temp_path = f.name
-            
-            # Play with pygame
-            pygame.mixer.music.load(temp_path)
-            pygame.mixer.music.play()
-            
-            if wait:
-                while pygame.mixer.music.get_busy() and not self._stop_event.is_set():
-                    await asyncio.sleep(0.1)
+            # Decode the MP3 once, then stream PCM to the output device
+            samples, sample_rate = sf.read(io.BytesIO(audio_data), dtype="int16", always_2d=True)
+            await self._play(samples, sample_rate, wait)
             
         except Exception as e:
             logger.error(f"Audio playback failed: {e}")
         finally:
             self._is_speaking = False
+    
+    async def _play(self, samples: np.ndarray, sample_rate: int, wait: bool) -> None:
+        """
+        Play int16 samples through sounddevice.
+        
+        Args:
+            samples: Audio as a (frames, channels) int16 array
+            sample_rate: Sample rate of the audio
+            wait: Whether to wait for playback to finish
+        """
+        self._close_stream()
+        
+        loop = asyncio.get_running_loop()
+        finished = asyncio.Event()
+        position = 0
+        
+        def callback(outdata, frames, time_info, status):
+            nonlocal position
+            chunk = samples[position:position + frames]
+            outdata[:len(chunk)] = chunk
+            position += len(chunk)
+            if len(chunk) < frames:
+                outdata[len(chunk):] = 0
+                raise sd.CallbackStop()
+        
+        def on_finished():
+            try:
+                loop.call_soon_threadsafe(finished.set)
+            except RuntimeError:
+                pass  # Loop already closed (e.g. speak_sync with wait=False)
+        
+        self._stream = sd.OutputStream(
+            samplerate=sample_rate,
+            channels=samples.shape[1],
+            dtype="int16",
+            callback=callback,
+            finished_callback=on_finished
+        )
+        self._stream.start()
+        
+        if wait:
+            # Set by the stream when playback ends or stop() aborts it
+            await finished.wait()
+            self._close_stream()
+    
+    def _close_stream(self) -> None:
+        """Close the current output stream, if any."""
+        stream, self._stream = self._stream, None
+        if stream is not None:
             try:
-                os.unlink(temp_path)
-            except:
+                stream.abort()
+                stream.close()
+            except Exception:
                 pass
     
-    def speak_sync(self, text: str, lang: str = "en", wait: bool = True) -> None:
+    def synthesize_sync(self, text: str, voice: Optional[str] = None, cache: bool = False) -> bytes:
+        """Synchronous wrapper for synthesize()."""
+        return run_sync(self.synthesize(text, voice, cache))
+    
+    def speak_sync(self, text: str, lang: str = "en", wait: bool = True, cache: bool = False) -> None:
         """Synchronous wrapper for speak()."""
-        asyncio.run(self.speak(text, lang, wait))
+        run_sync(self.speak(text, lang, wait, cache))
     
     async def speak_streaming(
         self,
@@ -196,41 +374,87 @@ class TextToSpeech:
         """
         Speak text as it's generated (for streaming LLM responses).
         
+        The next sentences are synthesized while the current one plays.
+        
         Args:
             text_generator: Async generator yielding text chunks
             lang: Language code
         """
-        buffer = ""
-        sentence_endings = ".!?;"
+        if not HAS_PLAYBACK:
+            logger.error("sounddevice/soundfile not available for audio playback")
+            return
         
-        async for chunk in text_generator:
-            buffer += chunk
-            
-            # Check if we have a complete sentence
-            for i, char in enumerate(buffer):
-                if char in sentence_endings:
-                    sentence = buffer[:i+1].strip()
-                    buffer = buffer[i+1:]
+        voice = self.get_voice_for_language(lang)
+        self._stop_event.clear()
+        
+        # (sentence, synthesis task) in speaking order. A slot is taken
+        # before each synthesis starts and freed once its clip is ready to
+        # play, so at most STREAM_SYNTH_AHEAD sentences run ahead of playback
+        clips: asyncio.Queue = asyncio.Queue()
+        ahead = asyncio.Semaphore(STREAM_SYNTH_AHEAD)
+        error: Optional[BaseException] = None
+        
+        async def enqueue(sentence: str) -> None:
+            await ahead.acquire()
+            clips.put_nowait((sentence, asyncio.create_task(self.synthesize(sentence, voice))))
+        
+        async def split_sentences() -> None:
+            nonlocal error
+            buffer = ""
+            try:
+                async for chunk in text_generator:
+                    buffer += chunk
                     
-                    if sentence:
-                        await self.speak(sentence, lang, wait=True)
+                    # Start synthesizing every complete sentence in the buffer
+                    while match := _SENTENCE_END.search(buffer):
+                        sentence = buffer[:match.end()].strip()
+                        buffer = buffer[match.end():]
                         
-                        if self._stop_event.is_set():
-                            return
+                        if sentence:
+                            await enqueue(sentence)
+                
+                # Remaining buffer
+                if buffer.strip():
+                    await enqueue(buffer.strip())
+            except Exception as e:
+                error = e
+            clips.put_nowait(None)
+        
+        splitter = asyncio.create_task(split_sentences())
+        try:
+            while (item := await clips.get()) is not None:
+                sentence, synthesis = item
+                audio_data = await synthesis
+                ahead.release()
+                
+                if self._stop_event.is_set():
+                    break
+                
+                if audio_data:
+                    logger.info("🔊 Speaking (%s): %.50s...", lang, sentence)
+                    await self._play_audio(audio_data, wait=True)
+                
+                if self._stop_event.is_set():
                     break
+        finally:
+            splitter.cancel()
+            while not clips.empty():
+                if item := clips.get_nowait():
+                    item[1].cancel()
         
-        # Speak remaining buffer
-        if buffer.strip():
-            await self.speak(buffer.strip(), lang, wait=True)
+        if error:
+            raise error
     
     def stop(self) -> None:
         """Stop current speech."""
         self._stop_event.set()
         
-        try:
-            pygame.mixer.music.stop()
-        except:
-            pass
+        # Aborting ends playback now and wakes the waiting speak()
+        if self._stream is not None:
+            try:
+                self._stream.abort()
+            except Exception:
+                pass
         
         self._is_speaking = False
         logger.debug("TTS stopped")
@@ -276,7 +500,7 @@ class TextToSpeech:
     @staticmethod
     def list_voices_sync(language: Optional[str] = None) -> List[dict]:
         """Synchronous wrapper for list_voices()."""
-        return asyncio.run(TextToSpeech.list_voices(language))
+        return run_sync(TextToSpeech.list_voices(language))
 
 
 async def demo_voice(voice_name: str, text: str = "Hello! This is a voice demo.") -> None:
@@ -3,7 +3,11 @@ Wake word detection using Porcupine.
 Listens for "Hey Nova" in the background.
 """
 
+import os
+import queue
+import selectors
 import struct
+import sys
 import threading
 import time
 from typing import Optional, Callable
@@ -23,6 +27,16 @@ except ImportError:
     HAS_PORCUPINE = False
     logger.warning("Porcupine not installed. Wake word detection disabled.")
 
+# Windows can't select() on stdin; poll the console instead
+try:
+    import msvcrt
+    HAS_MSVCRT = True
+except ImportError:
+    HAS_MSVCRT = False
+
+# How often PushToTalk checks whether it was stopped while waiting for input
+STDIN_POLL_INTERVAL = 0.25
+
 
 class WakeWordDetector:
     """
@@ -36,6 +50,9 @@ class WakeWordDetector:
         "ok google", "picovoice", "porcupine", "terminator"
     ]
     
+    # Built-in keywords in the form _init_porcupine matches against
+    _NORMALIZED_KEYWORDS = frozenset(k.replace(" ", "_") for k in BUILT_IN_KEYWORDS)
+    
     def __init__(
         self,
         access_key: Optional[str] = None,
@@ -63,6 +80,11 @@ class WakeWordDetector:
         self._callback: Optional[Callable[[], None]] = None
         self._stop_event = threading.Event()
         
+        # Detections handed from the audio thread to the dispatcher; one
+        # pending slot, so repeats while on_wake is still busy are dropped
+        self._wake_queue: "queue.Queue[bool]" = queue.Queue(maxsize=1)
+        self._dispatcher: Optional[threading.Thread] = None
+        
         # Check if Porcupine is available
         if not HAS_PORCUPINE:
             logger.warning("Wake word detection unavailable. Using push-to-talk mode.")
@@ -81,7 +103,7 @@ class WakeWordDetector:
             # Use built-in keyword
             keyword_to_use = self.keyword.lower().replace(" ", "_")
             
-            if keyword_to_use in [k.replace(" ", "_") for k in self.BUILT_IN_KEYWORDS]:
+            if keyword_to_use in self._NORMALIZED_KEYWORDS:
                 self._porcupine = pvporcupine.create(
                     access_key=self.access_key,
                     keywords=[self.keyword],
@@ -125,7 +147,10 @@ class WakeWordDetector:
         self._callback = on_wake
         self._stop_event.clear()
         self._is_listening = True
+        self._wake_queue = queue.Queue(maxsize=1)
         
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, daemon=True)
+        self._dispatcher.start()
         self._thread = threading.Thread(target=self._listen_loop, daemon=True)
         self._thread.start()
         logger.info("👂 Listening for wake word...")
@@ -135,32 +160,33 @@ class WakeWordDetector:
         try:
             frame_length = self._porcupine.frame_length
             sample_rate = self._porcupine.sample_rate
+            wake_queue = self._wake_queue
             
             def audio_callback(indata, frames, time_info, status):
                 if self._stop_event.is_set():
                     raise sd.CallbackAbort()
                 
-                # Convert to int16
-                audio_int16 = (indata[:, 0] * 32767).astype(np.int16)
-                
-                # Process with Porcupine
-                keyword_index = self._porcupine.process(audio_int16)
+                # The stream delivers PCM16, which Porcupine takes as-is
+                keyword_index = self._porcupine.process(indata[:, 0])
                 
                 if keyword_index >= 0:
-                    logger.info("🎯 Wake word detected!")
-                    if self._callback:
-                        self._callback()
+                    # Never run on_wake here: a slow handler would stall
+                    # the audio thread and leave stale frames queued
+                    try:
+                        wake_queue.put_nowait(True)
+                    except queue.Full:
+                        pass  # Previous detection not handled yet
             
             with sd.InputStream(
                 device=self.device,
                 channels=1,
                 samplerate=sample_rate,
                 blocksize=frame_length,
-                dtype=np.float32,
+                dtype=np.int16,
                 callback=audio_callback
             ):
-                while not self._stop_event.is_set():
-                    time.sleep(0.1)
+                # Block until stop(); the callback runs on PortAudio's thread
+                self._stop_event.wait()
                     
         except Exception as e:
             if not self._stop_event.is_set():
@@ -168,13 +194,37 @@ class WakeWordDetector:
         finally:
             self._is_listening = False
     
+    def _dispatch_loop(self) -> None:
+        """Call on_wake for each detection, off the audio thread."""
+        wake_queue = self._wake_queue
+        while True:
+            wake_queue.get()
+            if self._stop_event.is_set():
+                return
+            
+            logger.info("🎯 Wake word detected!")
+            if self._callback:
+                try:
+                    self._callback()
+                except Exception as e:
+                    logger.error(f"Wake word handler failed: {e}")
+    
     def stop(self) -> None:
         """Stop listening for wake word."""
         self._stop_event.set()
         self._is_listening = False
         
+        # Wake the dispatcher so it sees the stop
+        try:
+            self._wake_queue.put_nowait(False)
+        except queue.Full:
+            pass  # It will check the stop flag after the pending item
+        
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=1.0)
+        dispatcher = self._dispatcher
+        if dispatcher and dispatcher.is_alive() and dispatcher is not threading.current_thread():
+            dispatcher.join(timeout=1.0)
         
         logger.debug("Wake word detection stopped")
     
@@ -198,12 +248,24 @@ class PushToTalk:
     def __init__(self):
         self._waiting = False
         self._callback: Optional[Callable[[], None]] = None
+        self._eof_callback: Optional[Callable[[], None]] = None
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
     
-    def start(self, on_activate: Callable[[], None]) -> None:
-        """Start waiting for Enter key press."""
+    def start(
+        self,
+        on_activate: Callable[[], None],
+        on_eof: Optional[Callable[[], None]] = None
+    ) -> None:
+        """
+        Start waiting for Enter key press.
+        
+        Args:
+            on_activate: Called (from the reader thread) on each Enter press
+            on_eof: Called once if stdin is closed
+        """
         self._callback = on_activate
+        self._eof_callback = on_eof
         self._waiting = True
         self._stop_event.clear()
         
@@ -212,14 +274,52 @@ class PushToTalk:
         logger.info("⌨️ Press Enter to speak (push-to-talk mode)")
     
     def _wait_loop(self) -> None:
-        """Wait for keyboard input."""
-        while not self._stop_event.is_set():
+        """Wait for keyboard input, checking for stop() in between."""
+        selector = None
+        if not HAS_MSVCRT:
             try:
-                input()  # Wait for Enter
-                if self._callback and self._waiting:
-                    self._callback()
-            except EOFError:
-                break
+                selector = selectors.DefaultSelector()
+                selector.register(sys.stdin, selectors.EVENT_READ)
+            except (ValueError, OSError):
+                selector = None  # stdin isn't selectable; fall back to input()
+        
+        try:
+            while not self._stop_event.is_set():
+                if selector is not None:
+                    if not selector.select(timeout=STDIN_POLL_INTERVAL):
+                        continue
+                    # Read what's there directly so buffered lines aren't missed
+                    data = os.read(sys.stdin.fileno(), 4096)
+                    if not data:
+                        raise EOFError
+                    presses = data.count(b"\n")
+                else:
+                    if not self._console_ready():
+                        continue
+                    input()  # Wait for Enter
+                    presses = 1
+                
+                for _ in range(presses):
+                    if self._callback and self._waiting and not self._stop_event.is_set():
+                        self._callback()
+        except EOFError:
+            if self._eof_callback:
+                self._eof_callback()
+        finally:
+            if selector is not None:
+                selector.close()
+    
+    def _console_ready(self) -> bool:
+        """Wait briefly for a key press on a Windows console."""
+        if not (HAS_MSVCRT and sys.stdin.isatty()):
+            return True  # Can't poll this stdin; block in input() instead
+        
+        deadline = time.monotonic() + STDIN_POLL_INTERVAL
+        while not msvcrt.kbhit():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.02)
+        return True
     
     def stop(self) -> None:
         """Stop waiting."""
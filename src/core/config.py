@@ -3,24 +3,43 @@ Configuration management for Voice Assistant.
 Loads settings from config.yaml with environment variable overrides.
 """
 
+import copy
 import os
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import yaml
 from dotenv import load_dotenv
 
+# libyaml's loader parses several times faster; same safe semantics
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# config.yaml at the project root
+CONFIG_PATH = Path(__file__).parent.parent.parent / "config.yaml"
+
 
 class Config:
     """Central configuration manager."""
     
     _instance: Optional['Config'] = None
     _config: Dict[str, Any] = {}
+    _flat: Dict[Tuple[str, ...], Any] = {}
+    _public: Optional[Dict[str, Any]] = None
+    _mtime: Optional[int] = None  # config.yaml st_mtime_ns at last load
+    _lock = threading.Lock()
     
     def __new__(cls) -> 'Config':
         """Singleton pattern - only one config instance."""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._load()
+            # Web and audio threads may race here; only one may parse the file
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._load()
+                    cls._instance = instance
         return cls._instance
     
     def _load(self) -> None:
@@ -28,17 +47,37 @@ class Config:
         # Load .env file
         load_dotenv()
         
-        # Find config file
-        config_path = Path(__file__).parent.parent.parent / "config.yaml"
-        
-        if config_path.exists():
-            with open(config_path, 'r', encoding='utf-8') as f:
-                self._config = yaml.safe_load(f) or {}
+        self._mtime = self._file_mtime()
+        if self._mtime is not None:
+            with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
+                self._config = yaml.load(f, Loader=SafeLoader) or {}
         else:
             self._config = self._defaults()
             
         # Apply environment overrides
         self._apply_env_overrides()
+        
+        # Resolve every key path once so get() is a single lookup
+        flat: Dict[Tuple[str, ...], Any] = {}
+        self._flatten(self._config, (), flat)
+        self._flat = flat
+        self._public = None
+    
+    @staticmethod
+    def _file_mtime() -> Optional[int]:
+        """Modification time of config.yaml, or None if it doesn't exist."""
+        try:
+            return CONFIG_PATH.stat().st_mtime_ns
+        except OSError:
+            return None
+    
+    @classmethod
+    def _flatten(cls, value: Any, path: Tuple[str, ...], flat: Dict[Tuple[str, ...], Any]) -> None:
+        """Record value and all nested values under their key paths."""
+        flat[path] = value
+        if isinstance(value, dict):
+            for key, child in value.items():
+                cls._flatten(child, path + (key,), flat)
     
     def _defaults(self) -> Dict[str, Any]:
         """Default configuration values."""
@@ -50,7 +89,8 @@ class Config:
             },
             "whisper": {
                 "model": "base",
-                "device": "cpu"
+                "device": "cpu",
+                "compute_type": None
             },
             "tts": {
                 "engine": "edge",
@@ -104,15 +144,8 @@ class Config:
             config.get("openai", "model")  # Returns "gpt-4o-mini"
             config.get("audio", "sample_rate")  # Returns 16000
         """
-        value = self._config
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key)
-            else:
-                return default
-            if value is None:
-                return default
-        return value
+        value = self._flat.get(keys)
+        return default if value is None else value
     
     def __getitem__(self, key: str) -> Any:
         """Dict-like access: config["openai"]"""
@@ -138,6 +171,10 @@ class Config:
     def whisper_device(self) -> str:
         return self.get("whisper", "device", default="cpu")
     
+    @property
+    def whisper_compute_type(self) -> Optional[str]:
+        return self.get("whisper", "compute_type", default=None)
+    
     @property
     def tts_voice_en(self) -> str:
         return self.get("tts", "voice_en", default="en-US-AriaNeural")
@@ -199,16 +236,29 @@ class Config:
     def web_port(self) -> int:
         return self.get("web", "port", default=5000)
     
+    @property
+    def web_async_mode(self) -> str:
+        return self.get("web", "async_mode", default="threading")
+    
     def reload(self) -> None:
-        """Reload configuration from file."""
+        """Reload configuration from file (skipped if the file is unchanged)."""
+        if self._file_mtime() == self._mtime:
+            return
         self._load()
     
     def to_dict(self) -> Dict[str, Any]:
-        """Return full config as dictionary (excluding secrets)."""
-        config = self._config.copy()
-        # Remove sensitive values
-        if "openai" in config:
-            config["openai"] = {k: v for k, v in config["openai"].items() if k != "api_key"}
-        if "porcupine" in config:
-            config["porcupine"] = {k: v for k, v in config["porcupine"].items() if k != "access_key"}
-        return config
+        """
+        Return full config as dictionary (excluding secrets).
+        
+        The result is built once per load and shared; treat it as read-only.
+        """
+        if self._public is None:
+            # Deep copy so nothing handed out aliases the live config
+            config = copy.deepcopy(self._config)
+            # Remove sensitive values
+            if isinstance(config.get("openai"), dict):
+                config["openai"].pop("api_key", None)
+            if isinstance(config.get("porcupine"), dict):
+                config["porcupine"].pop("access_key", None)
+            self._public = config
+        return self._public
@@ -3,11 +3,13 @@ Logging configuration for Voice Assistant.
 Provides colored console output and file logging.
 """
 
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 try:
     import colorlog
@@ -20,6 +22,26 @@ except ImportError:
 _loggers = {}
 
 
+class _DeferredQueueHandler(QueueHandler):
+    """
+    Queue records as-is; the listener's handlers format them on its thread.
+    
+    The stock prepare() formats every record on the calling thread. The
+    queue never leaves the process, so nothing needs to be made picklable.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _FileLogListener(QueueListener):
+    """QueueListener whose stop() is safe to call again (e.g. at exit)."""
+    
+    def stop(self) -> None:
+        if self._thread is not None:
+            super().stop()
+
+
 def setup_logger(
     name: str = "nova",
     level: str = "INFO",
@@ -47,6 +69,13 @@ def setup_logger(
     logger.setLevel(getattr(logging, level.upper(), logging.INFO))
     logger.handlers = []  # Clear existing handlers
     
+    # None of our formats use caller, thread or process info; skip
+    # collecting it for every record
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
     # Console handler with colors
     if console:
         console_handler = logging.StreamHandler(sys.stdout)
@@ -89,7 +118,14 @@ def setup_logger(
             datefmt="%Y-%m-%d %H:%M:%S"
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        
+        # Formatting, writes and rotation happen on the listener's thread;
+        # callers (including audio callbacks) only pay for an enqueue
+        listener = _FileLogListener(queue.Queue(-1), file_handler, respect_handler_level=True)
+        logger.addHandler(_DeferredQueueHandler(listener.queue))
+        listener.start()
+        atexit.register(listener.stop)  # Flush queued records on exit
+        logger.queue_listener = listener
     
     _loggers[name] = logger
     return logger
@@ -3,13 +3,14 @@ Nova Voice Assistant - Web Dashboard
 Flask-based web interface for configuration and monitoring.
 """
 
-import asyncio
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request
 from flask_socketio import SocketIO, emit
 from pathlib import Path
-import json
+from typing import Dict, List
 
 import sys
+import threading
+import time
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.core.config import Config
@@ -19,13 +20,65 @@ from src.audio.tts import TextToSpeech
 
 logger = get_logger("nova.web")
 
+# Global state
+config = Config()
+
+
+def _select_async_mode(requested: str) -> str:
+    """
+    Pick the SocketIO async mode.
+    
+    Greenlet servers (cheap per connection) are used only when configured
+    and the process was monkey-patched at startup (see main.py); unpatched,
+    they would deadlock against the TTS loop thread.
+    
+    Args:
+        requested: web.async_mode from config
+    
+    Returns:
+        "eventlet", "gevent" or "threading"
+    """
+    try:
+        if requested == "eventlet":
+            from eventlet import patcher
+            if patcher.is_monkey_patched("thread"):
+                return requested
+        elif requested == "gevent":
+            from gevent import monkey
+            if monkey.is_module_patched("threading"):
+                return requested
+        elif requested == "threading":
+            return requested
+    except ImportError:
+        pass
+    
+    logger.warning(f"Web async mode '{requested}' unavailable or not patched, using threading")
+    return "threading"
+
+
+ASYNC_MODE = _select_async_mode(config.web_async_mode)
+if ASYNC_MODE == "eventlet":
+    from eventlet import tpool
+elif ASYNC_MODE == "gevent":
+    import gevent
+
 # Create Flask app
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'nova-voice-assistant-secret'
-socketio = SocketIO(app, cors_allowed_origins="*")
+socketio = SocketIO(app, async_mode=ASYNC_MODE, cors_allowed_origins="*")
 
-# Global state
-config = Config()
+# Default preview phrase; only this one is cached (custom text never is)
+PREVIEW_TEXT = "Hello! This is how I sound. I am your voice assistant."
+
+# Voice list changes rarely; refetch from edge-tts at most this often
+VOICES_TTL_SECONDS = 3600
+
+# One TextToSpeech per previewed voice, so its audio cache is reused
+_preview_tts: Dict[str, TextToSpeech] = {}
+_preview_lock = threading.Lock()
+
+# (fetched_at, voices) from the last successful list_voices call
+_voices_cache = (0.0, [])
 
 
 def create_app() -> Flask:
@@ -33,6 +86,30 @@ def create_app() -> Flask:
     return app
 
 
+def run_server(host: str, port: int, debug: bool = False) -> None:
+    """Serve the dashboard (HTTP and SocketIO) with the selected async mode."""
+    logger.debug(f"Web server async mode: {ASYNC_MODE}")
+    if ASYNC_MODE == "threading":
+        # Same Werkzeug server app.run() used; Flask-SocketIO wants it opted into
+        socketio.run(app, host=host, port=port, debug=debug, allow_unsafe_werkzeug=True)
+    else:
+        socketio.run(app, host=host, port=port, debug=debug)
+
+
+def _offload(func, *args):
+    """
+    Run a blocking call without stalling other clients.
+    
+    Under greenlet servers the call goes to a real OS thread, since
+    waiting on the TTS loop would otherwise block the whole hub.
+    """
+    if ASYNC_MODE == "eventlet":
+        return tpool.execute(func, *args)
+    if ASYNC_MODE == "gevent":
+        return gevent.get_hub().threadpool.apply(func, args)
+    return func(*args)
+
+
 @app.route('/')
 def index():
     """Main dashboard page."""
@@ -63,41 +140,62 @@ def list_conversations():
 @app.route('/api/conversations/<session_id>')
 def get_conversation(session_id):
     """Get a specific conversation."""
-    sessions = ConversationManager.list_sessions()
+    session = ConversationManager.find_session(session_id)
     
-    for session in sessions:
-        if session['session_id'] == session_id:
-            with open(session['path'], 'r') as f:
-                return jsonify(json.load(f))
+    if session:
+        return jsonify(ConversationManager.read_session(session['path']))
     
     return jsonify({"error": "Session not found"}), 404
 
 
+def _known_voices() -> List[dict]:
+    """Edge TTS voices, refetched at most every VOICES_TTL_SECONDS."""
+    global _voices_cache
+    
+    fetched_at, voices = _voices_cache
+    if not voices or time.monotonic() - fetched_at > VOICES_TTL_SECONDS:
+        voices = _offload(TextToSpeech.list_voices_sync)
+        if voices:
+            _voices_cache = (time.monotonic(), voices)
+    return voices
+
+
 @app.route('/api/voices')
 def list_voices():
     """List available TTS voices."""
     try:
-        voices = asyncio.run(TextToSpeech.list_voices())
-        return jsonify(voices)
+        return jsonify(_known_voices())
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
-@app.route('/api/voices/preview', methods=['POST'])
+def _get_preview_tts(voice: str) -> TextToSpeech:
+    """Get the shared TextToSpeech for a voice, creating it on first use."""
+    with _preview_lock:
+        tts = _preview_tts.get(voice)
+        if tts is None:
+            tts = _preview_tts[voice] = TextToSpeech(voice_en=voice)
+        return tts
+
+
+@app.route('/api/voices/preview', methods=['GET', 'POST'])
 def preview_voice():
-    """Preview a TTS voice."""
-    data = request.json
+    """Preview a TTS voice as MP3 audio (usable directly as an <audio> src)."""
+    data = request.get_json(silent=True) or request.args
     voice = data.get('voice', 'en-US-AriaNeural')
-    text = data.get('text', 'Hello, this is a voice preview.')
+    text = data.get('text', PREVIEW_TEXT)
     
     try:
-        tts = TextToSpeech(voice_en=voice)
-        audio = asyncio.run(tts.synthesize(text, voice))
+        # Only real voices get an instance, so clients can't grow the cache
+        known = {v["name"] for v in _known_voices()} or TextToSpeech.VOICES.keys()
+        if voice not in known:
+            return jsonify({"error": f"Unknown voice: {voice}"}), 400
         
-        # Return as base64
-        import base64
-        audio_b64 = base64.b64encode(audio).decode('utf-8')
-        return jsonify({"audio": audio_b64})
+        tts = _get_preview_tts(voice)
+        audio = _offload(tts.synthesize_sync, text, voice, text == PREVIEW_TEXT)
+        if not audio:
+            return jsonify({"error": "Voice synthesis failed"}), 502
+        return Response(audio, mimetype='audio/mpeg')
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -142,8 +240,4 @@ def handle_stop_listening():
 
 # Run standalone
 if __name__ == '__main__':
-    app.run(
-        host=config.web_host,
-        port=config.web_port,
-        debug=True
-    )
+    run_server(config.web_host, config.web_port, debug=True)
@@ -292,21 +292,12 @@ function renderVoices() {
 
 async function previewVoice(voiceName) {
     try {
-        const response = await fetch('/api/voices/preview', {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({
-                voice: voiceName,
-                text: 'Hello! This is how I sound. I am your voice assistant.'
-            })
-        });
+        // The server's default preview phrase is cached, so it's omitted here
+        const params = new URLSearchParams({ voice: voiceName });
         
-        const data = await response.json();
-        
-        if (data.audio) {
-            const audio = new Audio('data:audio/mp3;base64,' + data.audio);
-            audio.play();
-        }
+        // The endpoint returns MP3, so the browser can stream it directly
+        const audio = new Audio('/api/voices/preview?' + params);
+        await audio.play();
         
     } catch (error) {
         console.error('Failed to preview voice:', error);
@@ -1,21 +1,83 @@
+import asyncio
+import atexit
 import os
+import queue
+import re
+import threading
+import numpy as np
 from dotenv import load_dotenv
+from faster_whisper import WhisperModel
 import pyttsx3
 import speech_recognition as sr
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 # Load API key
 load_dotenv()
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
-# Initialize speech recognizer AND TTS engine ONCE (outside loop)
+# Initialize speech recognizer ONCE (outside loop)
 recognizer = sr.Recognizer()
 
+# Sentences are spoken by one background thread that owns the TTS engine
+# (pyttsx3 drivers must run on the thread that created them)
+SENTENCE_END = re.compile(r"[.!?…]\s")
+speech_queue = queue.Queue()
+
+
+def speaker():
+    engine = pyttsx3.init()
+    while (sentence := speech_queue.get()) is not None:
+        try:
+            engine.say(sentence)
+            engine.runAndWait()
+        except Exception as e:
+            print(f"⚠️ TTS Error: {e}")
+        finally:
+            speech_queue.task_done()
+    engine.stop()
+
+
+speaker_thread = threading.Thread(target=speaker, daemon=True)
+speaker_thread.start()
+atexit.register(speech_queue.put, None)
+
+# Local Whisper detects the language and transcribes in one pass (offline).
+# Loaded once; "base" matches whisper.model in config.yaml
+RECOGNITION_LANGUAGES = {"fr": "French", "en": "English"}
+WHISPER_SAMPLE_RATE = 16000
+whisper_model = WhisperModel(
+    "base",
+    device="cpu",
+    compute_type="int8",
+    cpu_threads=max(1, (os.cpu_count() or 2) // 2)
+)
+
+
+def transcribe(audio):
+    """Transcribe a recorded utterance; returns (text, language code)."""
+    pcm = audio.get_raw_data(convert_rate=WHISPER_SAMPLE_RATE, convert_width=2)
+    samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768
+
+    segments, info = whisper_model.transcribe(samples, beam_size=1, vad_filter=True)
+    language = info.language
+    if language not in RECOGNITION_LANGUAGES:
+        # Detected something else; redo it in the likelier of French/English
+        probs = dict(info.all_language_probs or ())
+        language = max(RECOGNITION_LANGUAGES, key=lambda lang: probs.get(lang, 0.0))
+        segments, _ = whisper_model.transcribe(
+            samples, language=language, beam_size=1, vad_filter=True
+        )
+
+    return "".join(segment.text for segment in segments).strip(), language
+
+
 # Adjust recognizer settings for better performance
 recognizer.pause_threshold = 0.8
 recognizer.energy_threshold = 300
 
-# Conversation memory
+# Conversation memory (system prompt + the last MAX_TURNS exchanges, the
+# same 20 messages as max_history in config.yaml)
+MAX_TURNS = 10
 conversation_history = [
     {
         "role": "system",
@@ -27,74 +89,93 @@ conversation_history = [
     }
 ]
 
+# Open the microphone once and keep the stream for the whole session
+# (opening PortAudio every turn costs time and buffers)
+microphone = sr.Microphone()
+source = microphone.__enter__()
+atexit.register(microphone.__exit__, None, None, None)
+
 # Calibrate for ambient noise once at startup
 print("Calibrating microphone... Please wait.")
-with sr.Microphone() as source:
-    recognizer.adjust_for_ambient_noise(source, duration=2)
+recognizer.adjust_for_ambient_noise(source, duration=2)
 
 print("\n✅ Voice bot is running! Say 'exit', 'quit', or 'stop' to end.\n")
 
-while True:
-    # 1️⃣ Record audio
-    with sr.Microphone() as source:
-        print("🎤 Listening...")
+
+def listen_once():
+    """Record one utterance from the microphone (blocking)."""
+    print("🎤 Listening...")
+    return recognizer.listen(source, timeout=5, phrase_time_limit=15)
+
+
+async def main():
+    loop = asyncio.get_running_loop()
+
+    while True:
+        # 1️⃣ Record audio (blocking mic I/O runs off the event loop)
         try:
-            audio = recognizer.listen(source, timeout=5, phrase_time_limit=15)
+            audio = await loop.run_in_executor(None, listen_once)
         except sr.WaitTimeoutError:
             print("⏱️ No speech detected. Try again.")
             continue
 
-    # 2️⃣ Convert speech → text (try French first, then English)
-    user_text = ""
-    for lang in ["fr-FR", "en-US"]:
-        try:
-            user_text = recognizer.recognize_google(audio, language=lang)
-            lang_name = "French" if lang == "fr-FR" else "English"
-            print(f"[Detected: {lang_name}]")
-            break
-        except sr.UnknownValueError:
-            continue
-        except sr.RequestError as e:
-            print(f"❌ Google Speech API error: {e}")
-            break
-
-    if not user_text:
-        print("❌ Sorry, could not understand. Please try again.")
-        continue
+        # 2️⃣ Convert speech → text (language detected in the same pass)
+        user_text, lang = await loop.run_in_executor(None, transcribe, audio)
 
-    print(f"💬 You said: {user_text}")
+        if not user_text:
+            print("❌ Sorry, could not understand. Please try again.")
+            continue
 
-    # Exit condition
-    if user_text.lower() in ["exit", "quit", "stop", "arrête", "arrêter"]:
-        print("👋 Goodbye!")
-        break
+        print(f"[Detected: {RECOGNITION_LANGUAGES[lang]}]")
 
-    # Add user message to conversation memory
-    conversation_history.append({"role": "user", "content": user_text})
+        print(f"💬 You said: {user_text}")
 
-    # 3️⃣ Send conversation → GPT
-    try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=conversation_history
-        )
-        bot_reply = response.choices[0].message.content
-        print(f"🤖 GPT: {bot_reply}\n")
+        # Exit condition
+        if user_text.lower().strip(" .!?") in ["exit", "quit", "stop", "arrête", "arrêter"]:
+            print("👋 Goodbye!")
+            break
 
-        # Add assistant reply to conversation memory
-        conversation_history.append({"role": "assistant", "content": bot_reply})
+        # Add user message to conversation memory
+        conversation_history.append({"role": "user", "content": user_text})
 
-        # 4️⃣ Convert GPT reply → speech
+        # 3️⃣ Send conversation → GPT (streamed)
         try:
-            engine = pyttsx3.init()
-            engine.say(bot_reply)
-            engine.runAndWait()
-            engine.stop()
-            # Force cleanup
-            del engine
+            stream = await client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=conversation_history,
+                stream=True
+            )
+
+            # 4️⃣ Speak each sentence as soon as it's complete
+            print("🤖 GPT: ", end="", flush=True)
+            parts = []
+            buffer = ""
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                print(delta, end="", flush=True)
+                parts.append(delta)
+                buffer += delta
+                while match := SENTENCE_END.search(buffer):
+                    speech_queue.put(buffer[:match.end()].strip())
+                    buffer = buffer[match.end():]
+            if buffer.strip():
+                speech_queue.put(buffer.strip())
+            print("\n")
+
+            # Add assistant reply to conversation memory
+            bot_reply = "".join(parts)
+            conversation_history.append({"role": "assistant", "content": bot_reply})
+            if len(conversation_history) > 1 + 2 * MAX_TURNS:
+                del conversation_history[1:-2 * MAX_TURNS]
+
+            # Don't listen while the reply is still being spoken
+            await loop.run_in_executor(None, speech_queue.join)
+
         except Exception as e:
-            print(f"⚠️ TTS Error: {e}")
+            print(f"❌ Error communicating with OpenAI: {e}")
+            continue
+
 
-    except Exception as e:
-        print(f"❌ Error communicating with OpenAI: {e}")
-        continue
\ No newline at end of file
+asyncio.run(main())